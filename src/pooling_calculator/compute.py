@@ -11,10 +11,28 @@ Architecture note: Functions are designed to be modular and composable,
 allowing future extension to hierarchical/multi-stage pooling workflows.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # Optional accelerator (pip install pooling-calculator[fast])
+    njit = None
+
+try:
+    import numexpr as ne
+except ImportError:  # Optional accelerator (pip install pooling-calculator[fast])
+    ne = None
+
 from pooling_calculator.config import (
-    MW_PER_BP,
+    MOLARITY_COEFF_NG_UL_TO_NM,
+    PRE_DILUTE_THRESHOLD_10X,
+    PRE_DILUTE_THRESHOLD_5X,
     MIN_TOTAL_VOLUME_UL,
     WARN_LOW_TOTAL_VOLUME_UL,
 )
@@ -49,12 +67,54 @@ def compute_molarity_from_concentration(
     # g/L → mol/L: divide by MW (g/mol)
     # mol/L → nmol/L (nM): multiply by 10^9
     # But ng/µl = µg/mL, so we need: (ng/µl × 10^6) / (MW_g/mol)
+    # 10^6 / MW_PER_BP is precomputed as MOLARITY_COEFF_NG_UL_TO_NM
 
-    molarity_nm = (concentration_ng_ul * 1_000_000) / (MW_PER_BP * fragment_size_bp)
+    molarity_nm = MOLARITY_COEFF_NG_UL_TO_NM * concentration_ng_ul / fragment_size_bp
 
     return molarity_nm
 
 
+@dataclass
+class PoolingResult:
+    """
+    Per-library arrays produced by the single-stage pooling pipeline.
+
+    Returned by compute_pooling_result() without building an augmented
+    DataFrame. Use attach_to_frame() to splice the columns back when a
+    frame is needed (display, Excel export).
+    """
+
+    calculated_nm: np.ndarray
+    effective_nm: np.ndarray
+    stock_vol: np.ndarray
+    pre_dilute: np.ndarray
+    final_vol: np.ndarray
+    flags: np.ndarray
+    pool_fraction: np.ndarray
+    expected_reads: np.ndarray | None = None
+
+    def to_columns(self) -> dict[str, np.ndarray]:
+        """
+        Map the result arrays to their output column names, in output order.
+
+        Returns:
+            Dictionary of column name → array (Expected Reads only if computed)
+        """
+        columns = {
+            "Calculated nM": self.calculated_nm,
+            "Effective nM (Use)": self.effective_nm,
+            "Adjusted lib nM": self.effective_nm,
+            "Stock Volume (µl)": self.stock_vol,
+            "Pre-Dilute Factor": self.pre_dilute,
+            "Final Volume (µl)": self.final_vol,
+            "Flags": self.flags,
+            "Pool Fraction": self.pool_fraction,
+        }
+        if self.expected_reads is not None:
+            columns["Expected Reads (M)"] = self.expected_reads
+        return columns
+
+
 def compute_effective_molarity(df: pd.DataFrame) -> pd.DataFrame:
     """
     Compute effective molarity for each library.
@@ -74,43 +134,15 @@ def compute_effective_molarity(df: pd.DataFrame) -> pd.DataFrame:
     Raises:
         ValueError: If required columns missing or calculations fail
     """
-    df = df.copy()
-
-    # Validate required columns
-    required = ["Final ng/ul", "Adjusted peak size"]
-    missing = [col for col in required if col not in df.columns]
-    if missing:
-        raise ValueError(f"Missing required columns: {missing}")
-
-    # Calculate molarity for all libraries
-    calculated_nm = []
-    for idx, row in df.iterrows():
-        conc = row["Final ng/ul"]
-        size = row["Adjusted peak size"]
-
-        try:
-            nm = compute_molarity_from_concentration(conc, size)
-            calculated_nm.append(nm)
-        except ValueError as e:
-            raise ValueError(f"Row {idx + 1}: {e}")
-
-    df["Calculated nM"] = calculated_nm
-
-    # Determine effective molarity (empirical if available, else calculated)
-    if "Empirical Library nM" in df.columns:
-        df["Effective nM (Use)"] = df.apply(
-            lambda row: row["Empirical Library nM"]
-            if pd.notna(row["Empirical Library nM"]) and row["Empirical Library nM"] > 0
-            else row["Calculated nM"],
-            axis=1
-        )
-    else:
-        df["Effective nM (Use)"] = df["Calculated nM"]
+    calculated_nm, effective_nm = _molarity_arrays(df)
 
+    # New columns are added with a single assign(); the caller's frame is not modified.
     # Adjusted lib nM is same as effective (no adapter dimer adjustment in current version)
-    df["Adjusted lib nM"] = df["Effective nM (Use)"]
-
-    return df
+    return df.assign(**{
+        "Calculated nM": calculated_nm,
+        "Effective nM (Use)": effective_nm,
+        "Adjusted lib nM": effective_nm,
+    })
 
 
 def compute_pool_volumes(
@@ -146,15 +178,327 @@ def compute_pool_volumes(
     Raises:
         ValueError: If required columns missing or parameters invalid
     """
-    df = df.copy()
+    _validate_volume_params(scaling_factor, min_volume_ul, max_volume_ul)
+
+    # Validate required columns
+    required = ["Adjusted lib nM", "Target Reads (M)"]
+    missing = [col for col in required if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    adj_lib_nm = df["Adjusted lib nM"].to_numpy(dtype=np.float64, na_value=np.nan)
+    stock_vol, pre_dilute, final_vol, flags, pool_fraction, expected_reads = _volume_arrays(
+        df, adj_lib_nm, scaling_factor, min_volume_ul, max_volume_ul, total_reads_m
+    )
+
+    new_columns = {
+        "Stock Volume (µl)": stock_vol,
+        "Pre-Dilute Factor": pre_dilute,
+        "Final Volume (µl)": final_vol,
+        "Flags": flags,
+        "Pool Fraction": pool_fraction,
+    }
+    if expected_reads is not None:
+        new_columns["Expected Reads (M)"] = expected_reads
+
+    # New columns are added with a single assign(); the caller's frame is not modified
+    return df.assign(**new_columns)
+
+
+def compute_pool_volumes_grouped(
+    df: pd.DataFrame,
+    group_column: str,
+    scaling_factor: float = 0.1,
+    min_volume_ul: float = 0.001,
+    max_volume_ul: float | None = None,
+    total_reads_m: float | None = None
+) -> pd.DataFrame:
+    """
+    Calculate volumes for several independent pools in a single pass.
+
+    Equivalent to calling compute_pool_volumes() on each group of group_column
+    and concatenating the results: volumes and flags are per library, while
+    the pool fraction (and expected reads) are normalized within each group.
+    Rows keep their input order.
 
-    # Import thresholds from config
-    from pooling_calculator.config import (
+    Args:
+        df: DataFrame with effective molarity, target reads and group_column
+        group_column: Column identifying the pool each library belongs to
+        scaling_factor: Volume scaling factor (default 0.1)
+        min_volume_ul: Minimum pipettable volume for flagging (default 0.001 µl)
+        max_volume_ul: Maximum volume per library (optional)
+        total_reads_m: Total sequencing reads per pool in millions (optional)
+
+    Returns:
+        DataFrame with added volume and metrics columns
+
+    Raises:
+        ValueError: If required columns missing or parameters invalid
+    """
+    _validate_volume_params(scaling_factor, min_volume_ul, max_volume_ul)
+
+    # Validate required columns
+    required = ["Adjusted lib nM", "Target Reads (M)", group_column]
+    missing = [col for col in required if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    # Steps 1-4 don't depend on the pool a library belongs to
+    adj_lib_nm = df["Adjusted lib nM"].to_numpy(dtype=np.float64, na_value=np.nan)
+    stock_vol, pre_dilute, final_vol, flags, _, _ = _volume_arrays(
+        df, adj_lib_nm, scaling_factor, min_volume_ul, max_volume_ul, None
+    )
+
+    # Step 5: Pool fraction within each group, with NaN-skipping group totals
+    group_codes, group_keys = pd.factorize(df[group_column], use_na_sentinel=False)
+    mol_contribution = stock_vol * adj_lib_nm
+    group_totals = np.bincount(
+        group_codes,
+        weights=np.where(np.isnan(mol_contribution), 0.0, mol_contribution),
+        minlength=len(group_keys),
+    )
+    pool_fraction = mol_contribution / group_totals[group_codes]
+
+    new_columns = {
+        "Stock Volume (µl)": stock_vol,
+        "Pre-Dilute Factor": pre_dilute,
+        "Final Volume (µl)": final_vol,
+        "Flags": flags,
+        "Pool Fraction": pool_fraction,
+    }
+    if total_reads_m is not None:
+        new_columns["Expected Reads (M)"] = pool_fraction * total_reads_m
+
+    # New columns are added with a single assign(); the caller's frame is not modified
+    return df.assign(**new_columns)
+
+
+def compute_pooling_result(
+    df: pd.DataFrame,
+    scaling_factor: float = 0.1,
+    min_volume_ul: float = 0.001,
+    max_volume_ul: float | None = None,
+    total_reads_m: float | None = None
+) -> PoolingResult:
+    """
+    Run molarity and volume calculations and return the raw per-library arrays.
+
+    Equivalent to compute_effective_molarity() followed by compute_pool_volumes(),
+    but no intermediate or augmented DataFrame is built.
+
+    Args:
+        df: DataFrame with normalized column names
+        scaling_factor: Volume scaling factor (default 0.1)
+        min_volume_ul: Minimum pipettable volume for flagging (default 0.001 µl)
+        max_volume_ul: Maximum volume per library (optional)
+        total_reads_m: Total sequencing reads in millions (optional, for reporting)
+
+    Returns:
+        PoolingResult with one entry per library, in input row order
+
+    Raises:
+        ValueError: If required columns missing, calculations fail or parameters invalid
+    """
+    _validate_volume_params(scaling_factor, min_volume_ul, max_volume_ul)
+    if "Target Reads (M)" not in df.columns:
+        raise ValueError("Missing required columns: ['Target Reads (M)']")
+
+    calculated_nm, effective_nm = _molarity_arrays(df)
+    stock_vol, pre_dilute, final_vol, flags, pool_fraction, expected_reads = _volume_arrays(
+        df, effective_nm, scaling_factor, min_volume_ul, max_volume_ul, total_reads_m
+    )
+
+    return PoolingResult(
+        calculated_nm=calculated_nm,
+        effective_nm=effective_nm,
+        stock_vol=stock_vol,
+        pre_dilute=pre_dilute,
+        final_vol=final_vol,
+        flags=flags,
+        pool_fraction=pool_fraction,
+        expected_reads=expected_reads,
+    )
+
+
+def attach_to_frame(df: pd.DataFrame, result: PoolingResult) -> pd.DataFrame:
+    """
+    Splice a PoolingResult back onto its input frame.
+
+    All columns are added with one assign(), so the frame is consolidated
+    once rather than once per column.
+
+    Args:
+        df: DataFrame the result was computed from
+        result: Output of compute_pooling_result()
+
+    Returns:
+        New DataFrame with the computed columns added
+
+    Raises:
+        ValueError: If the result length doesn't match the frame
+    """
+    if len(result.final_vol) != len(df):
+        raise ValueError(
+            f"Result has {len(result.final_vol)} rows, DataFrame has {len(df)}"
+        )
+    return df.assign(**result.to_columns())
+
+
+# Most recent pipeline results, keyed on table content + parameters. UI
+# handlers run on worker threads, so every access holds the lock
+_PIPELINE_CACHE: "OrderedDict[tuple, PoolingResult]" = OrderedDict()
+_PIPELINE_CACHE_SIZE = 16
+_PIPELINE_CACHE_LOCK = threading.Lock()
+
+
+def compute_table_key(df: pd.DataFrame) -> bytes:
+    """
+    Content-addressed key for a library table.
+
+    Hashes the cell values, index and column names, so two frames with the
+    same contents get the same key regardless of object identity. The UI
+    can compute this once per upload and pass it to
+    compute_pooling_result_cached().
+
+    Args:
+        df: Library DataFrame
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("|".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.digest()
+
+
+def compute_pooling_result_cached(
+    df: pd.DataFrame,
+    scaling_factor: float = 0.1,
+    min_volume_ul: float = 0.001,
+    max_volume_ul: float | None = None,
+    total_reads_m: float | None = None,
+    table_key: bytes | None = None,
+) -> PoolingResult:
+    """
+    compute_pooling_result() with an LRU cache of recent results.
+
+    Interactive re-runs with a parameter combination already seen for the
+    same table return the stored result. The pre-dilution thresholds are
+    part of the key, so a cached entry is never reused after they change.
+    Cached arrays are shared between hits and must not be modified in place.
+    Safe to call from multiple threads; the computation itself runs outside
+    the cache lock.
+
+    Args:
+        df: DataFrame with normalized column names
+        scaling_factor: Volume scaling factor (default 0.1)
+        min_volume_ul: Minimum pipettable volume for flagging (default 0.001 µl)
+        max_volume_ul: Maximum volume per library (optional)
+        total_reads_m: Total sequencing reads in millions (optional)
+        table_key: Precomputed compute_table_key(df) (computed if omitted)
+
+    Returns:
+        PoolingResult with one entry per library, in input row order
+
+    Raises:
+        ValueError: If required columns missing, calculations fail or parameters invalid
+    """
+    if table_key is None:
+        table_key = compute_table_key(df)
+
+    key = (
+        table_key,
+        scaling_factor,
+        min_volume_ul,
+        max_volume_ul,
+        total_reads_m,
         PRE_DILUTE_THRESHOLD_10X,
         PRE_DILUTE_THRESHOLD_5X,
     )
+    with _PIPELINE_CACHE_LOCK:
+        cached = _PIPELINE_CACHE.get(key)
+        if cached is not None:
+            _PIPELINE_CACHE.move_to_end(key)
+            return cached
+
+    result = compute_pooling_result(
+        df,
+        scaling_factor=scaling_factor,
+        min_volume_ul=min_volume_ul,
+        max_volume_ul=max_volume_ul,
+        total_reads_m=total_reads_m,
+    )
 
-    # Validate inputs
+    with _PIPELINE_CACHE_LOCK:
+        _PIPELINE_CACHE[key] = result
+        _PIPELINE_CACHE.move_to_end(key)
+        if len(_PIPELINE_CACHE) > _PIPELINE_CACHE_SIZE:
+            _PIPELINE_CACHE.popitem(last=False)
+
+    return result
+
+
+def _molarity_arrays(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute calculated and effective molarity arrays for each library.
+
+    Args:
+        df: DataFrame with normalized column names
+
+    Returns:
+        Tuple of (calculated_nm, effective_nm) arrays
+
+    Raises:
+        ValueError: If required columns missing or an input is not positive
+    """
+    # Column membership is resolved once against a set
+    columns = set(df.columns)
+    has_empirical = "Empirical Library nM" in columns
+
+    # Validate required columns
+    required = ["Final ng/ul", "Adjusted peak size"]
+    missing = [col for col in required if col not in columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    conc = df["Final ng/ul"].to_numpy(dtype=np.float64, na_value=np.nan)
+    size = df["Adjusted peak size"].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # Report the first offending row using the scalar function's error message
+    invalid = (conc <= 0) | (size <= 0)
+    if invalid.any():
+        row = int(np.argmax(invalid))
+        try:
+            compute_molarity_from_concentration(conc[row], size[row])
+        except ValueError as e:
+            raise ValueError(f"Row {row + 1}: {e}") from e
+
+    # Calculate molarity for all libraries
+    calculated_nm = MOLARITY_COEFF_NG_UL_TO_NM * conc / size
+
+    # Determine effective molarity (empirical if available, else calculated)
+    if has_empirical:
+        empirical_nm = df["Empirical Library nM"].to_numpy(dtype=np.float64, na_value=np.nan)
+        use_empirical = np.isfinite(empirical_nm) & (empirical_nm > 0)
+        effective_nm = np.where(use_empirical, empirical_nm, calculated_nm)
+    else:
+        effective_nm = calculated_nm
+
+    return calculated_nm, effective_nm
+
+
+def _validate_volume_params(
+    scaling_factor: float,
+    min_volume_ul: float,
+    max_volume_ul: float | None,
+) -> None:
+    """
+    Validate volume calculation parameters.
+
+    Raises:
+        ValueError: If any parameter is out of range
+    """
     if scaling_factor <= 0:
         raise ValueError(f"Scaling factor must be > 0, got {scaling_factor}")
     if min_volume_ul < 0:
@@ -162,87 +506,261 @@ def compute_pool_volumes(
     if max_volume_ul is not None and max_volume_ul < 0:
         raise ValueError(f"Max volume must be >= 0, got {max_volume_ul}")
 
-    # Validate required columns
-    required = ["Adjusted lib nM", "Target Reads (M)"]
-    missing = [col for col in required if col not in df.columns]
-    if missing:
-        raise ValueError(f"Missing required columns: {missing}")
 
-    # Step 1: Calculate stock volume using CORRECT formula from spreadsheet
-    # Formula: stock_vol = scaling_factor / adj_lib_nM * target_reads_M
-    # This is from Cell AF in the reference spreadsheet: =$AA$4/R*Q
-    df["Stock Volume (µl)"] = (scaling_factor / df["Adjusted lib nM"]) * df["Target Reads (M)"]
-
-    # Step 2: Determine pre-dilution factor based on stock volume
-    # Logic from Column Z in reference spreadsheet
-    # IF stock_vol < 0.2: dilute 10x
-    # ELIF stock_vol < 0.795: dilute 5x
-    # ELSE: no dilution (1x)
-    def calculate_pre_dilute_factor(stock_vol):
-        """
-        Calculate pre-dilution factor based on stock volume.
+def _volume_arrays(
+    df: pd.DataFrame,
+    adj_lib_nm: np.ndarray,
+    scaling_factor: float,
+    min_volume_ul: float,
+    max_volume_ul: float | None,
+    total_reads_m: float | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray | None]:
+    """
+    Compute volumes, flags and pool metrics for each library (steps 1-5 of
+    compute_pool_volumes).
 
-        Thresholds are configurable in config.py:
-        - PRE_DILUTE_THRESHOLD_10X = 0.2 µL (default)
-        - PRE_DILUTE_THRESHOLD_5X = 0.795 µL (default)
-        """
-        if stock_vol < PRE_DILUTE_THRESHOLD_10X:
-            return 10
-        elif stock_vol < PRE_DILUTE_THRESHOLD_5X:
-            return 5
+    Args:
+        df: DataFrame providing Target Reads (M) and, optionally, Total Volume
+        adj_lib_nm: Adjusted library molarity (nM) per library
+        scaling_factor: Volume scaling factor
+        min_volume_ul: Minimum pipettable volume for flagging
+        max_volume_ul: Maximum volume per library (optional)
+        total_reads_m: Total sequencing reads in millions (optional)
+
+    Returns:
+        Tuple of (stock_vol, pre_dilute, final_vol, flags, pool_fraction,
+        expected_reads); expected_reads is None when total_reads_m is not given
+    """
+    # Steps 1-3 (stock volume, pre-dilution, final volume) and the step 5 pool
+    # fraction are computed together on the raw arrays, see _compute_volume_arrays
+    target_reads = df["Target Reads (M)"].to_numpy(dtype=np.float64, na_value=np.nan)
+    stock_vol, pre_dilute, final_vol, pool_fraction = _compute_volume_arrays(
+        adj_lib_nm,
+        target_reads,
+        scaling_factor,
+        PRE_DILUTE_THRESHOLD_10X,
+        PRE_DILUTE_THRESHOLD_5X,
+    )
+
+    # Step 4: Validation checks and flag problematic libraries
+    # Messages are only formatted for the rows that trip each check and are
+    # appended in place, so unflagged rows cost nothing beyond the mask test
+    flags = np.full(len(final_vol), "", dtype=object)
+
+    # Check against total available volume
+    if "Total Volume" in df.columns:
+        available = df["Total Volume"].to_numpy(dtype=np.float64, na_value=np.nan)
+        _append_flags(
+            flags,
+            final_vol > available,
+            "Insufficient volume (need {need:.3f} µl, have {have:.3f} µl)",
+            need=final_vol,
+            have=available,
+        )
+
+    # Informational flag for pre-dilution
+    _append_flags(
+        flags,
+        pre_dilute > 1,
+        "Pre-dilute {factor}x recommended (stock vol {stock:.3f} µl)",
+        factor=pre_dilute,
+        stock=stock_vol,
+    )
+
+    # Check minimum pipettable volume (should be rare with pre-dilution)
+    _append_flags(
+        flags,
+        final_vol < min_volume_ul,
+        f"Below minimum pipettable volume ({{vol:.6f}} µl < {min_volume_ul} µl)",
+        vol=final_vol,
+    )
+
+    # Check maximum volume constraint
+    if max_volume_ul is not None:
+        _append_flags(
+            flags,
+            final_vol > max_volume_ul,
+            f"Exceeds maximum volume ({{vol:.3f}} µl > {max_volume_ul} µl)",
+            vol=final_vol,
+        )
+
+    # Step 5: Pool fraction: f[i] = (V[i] * C[i]) / sum(V[j] * C[j]);
+    # expected reads only if total reads provided
+    expected_reads = pool_fraction * total_reads_m if total_reads_m is not None else None
+
+    return stock_vol, pre_dilute, final_vol, flags, pool_fraction, expected_reads
+
+
+def _volume_arrays_numpy(
+    adj_lib_nm: np.ndarray,
+    target_reads: np.ndarray,
+    scaling_factor: float,
+    threshold_10x: float,
+    threshold_5x: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute stock volume, pre-dilution factor, final volume and pool fraction.
+
+    Formulas (from the reference spreadsheet):
+    - stock_vol = scaling_factor / adj_lib_nM * target_reads_M  (Column AF)
+    - pre_dilute = 10 if stock_vol < threshold_10x, 5 if < threshold_5x, else 1  (Column Z)
+    - final_vol = stock_vol * pre_dilute  (Column AA)
+    - pool_fraction = stock_vol * adj_lib_nM / sum(stock_vol * adj_lib_nM)
+      (stock volume, before dilution, is used for the pool fraction)
+
+    Args:
+        adj_lib_nm: Adjusted library molarity (nM) per library
+        target_reads: Target reads (M) per library
+        scaling_factor: Volume scaling factor
+        threshold_10x: Stock volume below which 10x pre-dilution is recommended
+        threshold_5x: Stock volume below which 5x pre-dilution is recommended
+
+    Returns:
+        Tuple of (stock_vol, pre_dilute, final_vol, pool_fraction) arrays
+    """
+    stock_vol = scaling_factor / adj_lib_nm * target_reads
+    pre_dilute = np.select(
+        [stock_vol < threshold_10x, stock_vol < threshold_5x],
+        [10, 5],
+        default=1,
+    )
+    final_vol = stock_vol * pre_dilute
+
+    # Reuse the molar-contribution buffer for the fraction (nansum matches
+    # pandas' skipna semantics for libraries with missing inputs)
+    pool_fraction = np.multiply(stock_vol, adj_lib_nm)
+    np.divide(pool_fraction, np.nansum(pool_fraction), out=pool_fraction)
+
+    return stock_vol, pre_dilute, final_vol, pool_fraction
+
+
+def _volume_arrays_numexpr(
+    adj_lib_nm: np.ndarray,
+    target_reads: np.ndarray,
+    scaling_factor: float,
+    threshold_10x: float,
+    threshold_5x: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    numexpr equivalent of _volume_arrays_numpy.
+
+    Each expression is evaluated as one fused, blocked pass without
+    NumPy temporaries, and numexpr releases the GIL while it runs.
+    """
+    local_dict = {
+        "nm": adj_lib_nm,
+        "reads": target_reads,
+        "scaling_factor": scaling_factor,
+        "t10": threshold_10x,
+        "t5": threshold_5x,
+    }
+    stock_vol = ne.evaluate("scaling_factor / nm * reads", local_dict=local_dict)
+    local_dict["stock"] = stock_vol
+
+    # numexpr evaluates integer literals as int32; widen to match the other backends
+    pre_dilute = ne.evaluate(
+        "where(stock < t10, 10, where(stock < t5, 5, 1))", local_dict=local_dict
+    ).astype(np.int64)
+    local_dict["factor"] = pre_dilute
+    final_vol = ne.evaluate("stock * factor", local_dict=local_dict)
+
+    pool_fraction = ne.evaluate("stock * nm", local_dict=local_dict)
+    local_dict["mol"] = pool_fraction
+    local_dict["total_mol"] = np.nansum(pool_fraction)
+    ne.evaluate("mol / total_mol", local_dict=local_dict, out=pool_fraction)
+
+    return stock_vol, pre_dilute, final_vol, pool_fraction
+
+
+def _volume_kernel(
+    adj_lib_nm: np.ndarray,
+    target_reads: np.ndarray,
+    scaling_factor: float,
+    threshold_10x: float,
+    threshold_5x: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Single-loop equivalent of _volume_arrays_numpy, compiled with Numba when available.
+
+    Fuses all per-library arithmetic into one pass over preallocated outputs
+    plus a second pass to normalize the pool fraction.
+    """
+    n = adj_lib_nm.shape[0]
+    stock_vol = np.empty(n, dtype=np.float64)
+    pre_dilute = np.empty(n, dtype=np.int64)
+    final_vol = np.empty(n, dtype=np.float64)
+    pool_fraction = np.empty(n, dtype=np.float64)
+
+    total_mol = 0.0
+    for i in range(n):
+        stock = scaling_factor / adj_lib_nm[i] * target_reads[i]
+        if stock < threshold_10x:
+            factor = 10
+        elif stock < threshold_5x:
+            factor = 5
         else:
-            return 1
+            factor = 1
 
-    df["Pre-Dilute Factor"] = df["Stock Volume (µl)"].apply(calculate_pre_dilute_factor)
+        stock_vol[i] = stock
+        pre_dilute[i] = factor
+        final_vol[i] = stock * factor
 
-    # Step 3: Calculate final volume (volume to actually pipette)
-    # Formula from Column AA: vol = stock_vol * pre_dilute_factor
-    df["Final Volume (µl)"] = df["Stock Volume (µl)"] * df["Pre-Dilute Factor"]
+        mol = stock * adj_lib_nm[i]
+        pool_fraction[i] = mol
+        if not np.isnan(mol):
+            total_mol += mol
 
-    # Initialize flags column
-    df["Flags"] = ""
+    for i in range(n):
+        pool_fraction[i] = pool_fraction[i] / total_mol
+
+    return stock_vol, pre_dilute, final_vol, pool_fraction
 
-    # Step 4: Validation checks and flag problematic libraries
-    for idx, row in df.iterrows():
-        flags = []
-        stock_vol = row["Stock Volume (µl)"]
-        final_vol = row["Final Volume (µl)"]
-        pre_dilute = row["Pre-Dilute Factor"]
-
-        # Check against total available volume
-        if "Total Volume" in df.columns:
-            available = row["Total Volume"]
-            if final_vol > available:
-                flags.append(f"Insufficient volume (need {final_vol:.3f} µl, have {available:.3f} µl)")
-
-        # Informational flag for pre-dilution
-        if pre_dilute > 1:
-            flags.append(f"Pre-dilute {pre_dilute}x recommended (stock vol {stock_vol:.3f} µl)")
-
-        # Check minimum pipettable volume (should be rare with pre-dilution)
-        if final_vol < min_volume_ul:
-            flags.append(f"Below minimum pipettable volume ({final_vol:.6f} µl < {min_volume_ul} µl)")
-
-        # Check maximum volume constraint
-        if max_volume_ul is not None and final_vol > max_volume_ul:
-            flags.append(f"Exceeds maximum volume ({final_vol:.3f} µl > {max_volume_ul} µl)")
-
-        df.at[idx, "Flags"] = "; ".join(flags)
-
-    # Step 5: Calculate pool fraction: f[i] = (V[i] * C[i]) / sum(V[j] * C[j])
-    # Use stock volume (before dilution) for pool fraction calculation
-    df["_mol_contribution"] = df["Stock Volume (µl)"] * df["Adjusted lib nM"]
-    total_mol = df["_mol_contribution"].sum()
-    df["Pool Fraction"] = df["_mol_contribution"] / total_mol
-
-    # Calculate expected reads if total reads provided
-    if total_reads_m is not None:
-        df["Expected Reads (M)"] = df["Pool Fraction"] * total_reads_m
 
-    # Clean up temporary columns
-    df = df.drop(columns=["_mol_contribution"])
+# Prefer the compiled loop, then numexpr, then plain NumPy
+if njit is not None:
+    _compute_volume_arrays = njit(cache=True, error_model="numpy")(_volume_kernel)
+elif ne is not None:
+    _compute_volume_arrays = _volume_arrays_numexpr
+else:
+    _compute_volume_arrays = _volume_arrays_numpy
 
-    return df
+
+def _append_flags(
+    flags: np.ndarray,
+    mask: np.ndarray,
+    template: str,
+    **values: np.ndarray,
+) -> None:
+    """
+    Append one sanity-check message to the flags of the rows that trip it.
+
+    Messages are joined with "; " onto any flags already present. Only the
+    rows selected by mask are formatted or touched.
+
+    Args:
+        flags: Object array of per-row flag strings, updated in place
+        mask: Boolean array marking the rows that trip the check
+        template: str.format template for the message
+        **values: Per-row arrays referenced by name in the template
+    """
+    rows = np.flatnonzero(mask)
+    if rows.size == 0:
+        return
+
+    messages = np.array(
+        [template.format(**{name: arr[i] for name, arr in values.items()}) for i in rows],
+        dtype=object,
+    )
+    current = flags[rows]
+    flags[rows] = np.where(current == "", messages, current + "; " + messages)
+
+
+# (library column, summary column) pairs summed per project
+_PROJECT_SUM_COLUMNS = (
+    ("Stock Volume (µl)", "Total Volume (µl)"),
+    ("Pool Fraction", "Pool Fraction"),
+    ("Expected Reads (M)", "Expected Reads (M)"),
+)
 
 
 def summarize_by_project(df: pd.DataFrame) -> pd.DataFrame:
@@ -258,26 +776,28 @@ def summarize_by_project(df: pd.DataFrame) -> pd.DataFrame:
     Raises:
         ValueError: If required columns missing
     """
+    columns = set(df.columns)
+
     # Validate required columns
-    if "Project ID" not in df.columns:
+    if "Project ID" not in columns:
         raise ValueError("Missing required column: Project ID")
 
-    # Group by project
-    grouped = df.groupby("Project ID")
+    # Build the aggregation spec up front so all metrics come from one groupby pass
+    aggregations = {"Number of Libraries": ("Project ID", "size")}
+    for source, output in _PROJECT_SUM_COLUMNS:
+        if source in columns:
+            aggregations[output] = (source, "sum")
 
-    # Aggregate metrics
-    summary = pd.DataFrame({
-        "Project ID": grouped["Project ID"].first(),
-        "Number of Libraries": grouped.size(),
-        "Total Volume (µl)": grouped["Stock Volume (µl)"].sum() if "Stock Volume (µl)" in df.columns else 0,
-        "Pool Fraction": grouped["Pool Fraction"].sum() if "Pool Fraction" in df.columns else 0,
-    })
-
-    # Add expected reads if available
-    if "Expected Reads (M)" in df.columns:
-        summary["Expected Reads (M)"] = grouped["Expected Reads (M)"].sum()
+    summary = (
+        df.groupby("Project ID", sort=False, observed=True)
+        .agg(**aggregations)
+        .reset_index()
+    )
 
-    # Reset index for clean output
-    summary = summary.reset_index(drop=True)
+    # Keep the summary layout stable when volumes haven't been computed yet
+    if "Total Volume (µl)" not in summary.columns:
+        summary.insert(2, "Total Volume (µl)", 0)
+    if "Pool Fraction" not in summary.columns:
+        summary.insert(3, "Pool Fraction", 0)
 
     return summary
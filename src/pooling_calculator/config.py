@@ -5,6 +5,9 @@ This module contains scientific constants, default parameters, and column name
 mappings used throughout the application.
 """
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Final
 
 # ============================================================================
@@ -14,6 +17,10 @@ from typing import Final
 # Average molecular weight per base pair for double-stranded DNA (g/mol)
 MW_PER_BP: Final[float] = 660.0
 
+# Conversion factor from ng/µl per bp to nM: C_nM = coeff × C_ng/µl / L_bp
+# (1e6 / MW_PER_BP, folded at import time)
+MOLARITY_COEFF_NG_UL_TO_NM: Final[float] = 1_000_000.0 / MW_PER_BP
+
 # ============================================================================
 # Default Parameters
 # ============================================================================
@@ -79,6 +86,17 @@ OPTIONAL_COLUMNS: Final[list[str]] = [
     "Empirical Library nM",
 ]
 
+# Storage dtypes for numeric input columns, applied after loading so every
+# measurement column shares one float64 block. Text columns keep pandas'
+# inferred dtype (e.g. numeric-looking barcodes stay as read).
+LIBRARY_DTYPES: Final[Mapping[str, str]] = MappingProxyType({
+    "Final ng/ul": "float64",
+    "Total Volume": "float64",
+    "Adjusted peak size": "float64",
+    "Target Reads (M)": "float64",
+    "Empirical Library nM": "float64",
+})
+
 # Column name aliases (for flexible matching)
 # Maps alternative names to standard internal names
 COLUMN_ALIASES: Final[dict[str, str]] = {
@@ -212,11 +230,14 @@ APP_DESCRIPTION: Final[str] = "NGS Library Pooling Utility"
 # ============================================================================
 
 
+@lru_cache(maxsize=1024)
 def normalize_column_name(name: str) -> str:
     """
     Normalize a column name for matching.
 
     Converts to lowercase, strips whitespace, and looks up aliases.
+    Results are memoized, since uploads built from the same spreadsheet
+    template repeat the same headers.
 
     Args:
         name: Raw column name from input file
@@ -224,20 +245,15 @@ def normalize_column_name(name: str) -> str:
     Returns:
         Standardized column name, or original if no match found
     """
-    # Strip whitespace and convert to lowercase
-    normalized = name.strip().lower()
-
-    # Check if it's an alias
-    if normalized in COLUMN_ALIASES:
-        return COLUMN_ALIASES[normalized]
+    return _COLUMN_LOOKUP.get(name.strip().lower(), name)
 
-    # Check if it matches a required/optional column (case-insensitive)
-    for col in REQUIRED_COLUMNS + OPTIONAL_COLUMNS:
-        if col.lower() == normalized:
-            return col
 
-    # Return original if no match
-    return name
+# Lowercased name → standard column name for normalize_column_name().
+# Aliases are merged last so they take precedence, as in the original lookup order.
+_COLUMN_LOOKUP: Final[Mapping[str, str]] = MappingProxyType({
+    **{col.lower(): col for col in REQUIRED_COLUMNS + OPTIONAL_COLUMNS},
+    **COLUMN_ALIASES,
+})
 
 
 def get_all_valid_column_names() -> list[str]:
@@ -7,6 +7,7 @@ ultra-high-plex experiments where pipetting hundreds of individual libraries
 into a single pool is impractical.
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Any
@@ -17,7 +18,7 @@ from pooling_calculator.models import (
     PoolingStageData,
     HierarchicalPoolingPlan,
 )
-from pooling_calculator.compute import compute_pool_volumes
+from pooling_calculator.compute import compute_pool_volumes, compute_pool_volumes_grouped
 from pooling_calculator.config import (
     PRE_DILUTE_THRESHOLD_10X,
     PRE_DILUTE_THRESHOLD_5X,
@@ -72,7 +73,16 @@ def determine_pooling_strategy(
         >>> analysis
         {'total_libraries': 110, 'num_projects': 2, 'recommended': True}
     """
-    total_libraries = len(df)
+    total_libraries = len(df.index)
+
+    # Strategy 1: Small experiment → single-stage (no column analysis needed)
+    if total_libraries <= max_libraries_per_pool:
+        return "single_stage", [], {
+            "total_libraries": total_libraries,
+            "max_libraries_per_pool": max_libraries_per_pool,
+            "reason": "Small experiment (<=96 libraries)",
+            "recommended": False,
+        }
 
     # Analysis results
     analysis = {
@@ -80,21 +90,19 @@ def determine_pooling_strategy(
         "max_libraries_per_pool": max_libraries_per_pool,
     }
 
-    # Strategy 1: Small experiment → single-stage
-    if total_libraries <= max_libraries_per_pool:
-        analysis["reason"] = "Small experiment (<=96 libraries)"
-        analysis["recommended"] = False
-        return "single_stage", [], analysis
-
     # Strategy 2: Analyze potential grouping columns
     grouping_options = []
+    columns = df.columns
 
     for col in HIERARCHICAL_GROUPING_COLUMNS:
-        if col not in df.columns:
+        if col not in columns:
             continue
 
-        # Count unique groups
-        unique_groups = df[col].nunique()
+        # Count unique groups (hash-based count; missing values form their
+        # own group, as they do in create_subpool_definitions). Zero counts
+        # are excluded so unused categories of a Categorical aren't counted.
+        group_counts = df[col].value_counts(dropna=False, sort=False)
+        unique_groups = int(np.count_nonzero(group_counts.to_numpy()))
         analysis[f"{col}_num_groups"] = unique_groups
 
         # Check if this column creates enough sub-pools
@@ -160,33 +168,31 @@ def create_subpool_definitions(
     if grouping_column not in df.columns:
         raise ValueError(f"Grouping column '{grouping_column}' not found in DataFrame")
 
-    df = df.copy()
-    subpool_ids = []
-
-    for group_name, group_df in df.groupby(grouping_column):
-        group_size = len(group_df)
+    groups = df.groupby(grouping_column, sort=False, observed=True, dropna=False)
+    group_labels = df[grouping_column].astype(str)
 
-        if group_size <= max_libraries_per_subpool:
-            # Single sub-pool for this group
-            subpool_ids.extend([f"{group_name}_pool"] * group_size)
-        else:
-            # Split into multiple sub-pools
-            num_subpools = (group_size + max_libraries_per_subpool - 1) // max_libraries_per_subpool
+    # Libraries are numbered within their group; groups larger than the
+    # limit are split into consecutive chunks of max_libraries_per_subpool
+    subpool_number = groups.cumcount() // max_libraries_per_subpool + 1
+    needs_split = groups[grouping_column].transform("size") > max_libraries_per_subpool
 
-            for i, (_, subgroup_df) in enumerate(
-                group_df.groupby(group_df.index // max_libraries_per_subpool), start=1
-            ):
-                subpool_id = f"{group_name}_pool_{i}"
-                subpool_ids.extend([subpool_id] * len(subgroup_df))
+    subpool_ids = np.where(
+        needs_split,
+        group_labels + "_pool_" + subpool_number.astype(str),
+        group_labels + "_pool",
+    )
 
-    df["SubPool ID"] = subpool_ids
-    return df
+    # Labels are aligned with the input rows; the caller's frame is not modified
+    return df.assign(**{"SubPool ID": subpool_ids})
 
 
 def compute_subpool_properties(
     df_libraries: pd.DataFrame,
     df_volumes: pd.DataFrame,
     subpool_id: str,
+    creation_date: datetime | None = None,
+    *,
+    assume_aligned: bool = False,
 ) -> SubPoolRecord:
     """
     Calculate properties of a sub-pool after pooling its member libraries.
@@ -198,6 +204,9 @@ def compute_subpool_properties(
         df_libraries: Original library data (with "Adjusted lib nM" column)
         df_volumes: Pooling volumes for libraries in this sub-pool
         subpool_id: Identifier for this sub-pool
+        creation_date: Timestamp for the record (default: now)
+        assume_aligned: If True, df_libraries and df_volumes describe the same
+            libraries in the same row order, and the merge on Library Name is skipped
 
     Returns:
         SubPoolRecord with calculated molarity and total volume
@@ -222,22 +231,36 @@ def compute_subpool_properties(
     if missing_vol_cols:
         raise ValueError(f"Missing required volume columns: {missing_vol_cols}")
 
-    # Merge library data with volumes
-    merged = df_libraries.merge(df_volumes[["Library Name", "Final Volume (µl)"]], on="Library Name")
+    if assume_aligned:
+        # Rows already correspond one-to-one
+        if len(df_libraries) != len(df_volumes):
+            raise ValueError(
+                f"Aligned inputs must have the same length, got {len(df_libraries)} "
+                f"libraries and {len(df_volumes)} volumes"
+            )
+        merged = df_libraries
+        volumes_ul = df_volumes["Final Volume (µl)"].to_numpy(dtype=np.float64)
+    else:
+        # Merge library data with volumes
+        merged = df_libraries.merge(
+            df_volumes[["Library Name", "Final Volume (µl)"]], on="Library Name"
+        )
+        volumes_ul = merged["Final Volume (µl)"].to_numpy(dtype=np.float64)
 
     # Calculate sub-pool properties
-    # Step 1: Total volume
-    total_volume_ul = merged["Final Volume (µl)"].sum()
+    library_nm = merged["Adjusted lib nM"].to_numpy(dtype=np.float64)
+
+    # Step 1: Total volume (nansum skips missing values, like pandas' sum)
+    total_volume_ul = float(np.nansum(volumes_ul))
 
     # Step 2: Total moles (nM × µL gives nanomoles)
-    merged["nanomoles"] = merged["Adjusted lib nM"] * merged["Final Volume (µl)"]
-    total_nanomoles = merged["nanomoles"].sum()
+    total_nanomoles = float(np.nansum(library_nm * volumes_ul))
 
     # Step 3: Sub-pool molarity
     calculated_nm = total_nanomoles / total_volume_ul if total_volume_ul > 0 else 0.0
 
     # Step 4: Sum target reads
-    target_reads_m = merged["Target Reads (M)"].sum()
+    target_reads_m = float(merged["Target Reads (M)"].sum())
 
     # Get member library names
     member_libraries = merged["Library Name"].tolist()
@@ -246,15 +269,24 @@ def compute_subpool_properties(
     parent_project_id = None
     if "Project ID" in df_libraries.columns and len(merged) > 0:
         # Use the project ID from the first library (should be same for all in sub-pool)
-        parent_project_id = merged["Project ID"].iloc[0]
+        parent_project_id = str(merged["Project ID"].iat[0])
+
+    # The record is built without re-running Pydantic validation, so the
+    # gt=0 constraints of SubPoolRecord are enforced here instead (written
+    # as "not > 0" so NaN is rejected too, as the field validation would)
+    if not (total_volume_ul > 0 and calculated_nm > 0 and target_reads_m > 0):
+        raise ValueError(
+            f"Sub-pool '{subpool_id}' must have positive volume, molarity and target reads, "
+            f"got {total_volume_ul} µl, {calculated_nm} nM, {target_reads_m} M"
+        )
 
-    return SubPoolRecord(
+    return SubPoolRecord.model_construct(
         subpool_id=subpool_id,
         member_libraries=member_libraries,
         calculated_nm=calculated_nm,
         total_volume_ul=total_volume_ul,
         target_reads_m=target_reads_m,
-        creation_date=datetime.now(),
+        creation_date=creation_date if creation_date is not None else datetime.now(),
         parent_project_id=parent_project_id,
         custom_grouping=None,
     )
@@ -315,38 +347,49 @@ def compute_hierarchical_pooling(
     if grouping_column not in df.columns:
         raise ValueError(f"Grouping column '{grouping_column}' not found in DataFrame")
 
+    # One timestamp for the whole plan and all of its sub-pool records
+    created_at = datetime.now()
+
     # ========== STAGE 1: Libraries → Sub-pools ==========
 
     # Create sub-pool definitions
     df_with_subpools = create_subpool_definitions(df, grouping_column=grouping_column)
 
-    # Compute volumes for each sub-pool
-    subpool_records = []
-    stage1_volumes_list = []
-
-    for subpool_id in df_with_subpools["SubPool ID"].unique():
-        # Get libraries for this sub-pool
-        subpool_df = df_with_subpools[df_with_subpools["SubPool ID"] == subpool_id].copy()
-
-        # Compute pooling volumes for this sub-pool
-        subpool_volumes = compute_pool_volumes(
-            subpool_df,
-            scaling_factor=scaling_factor,
-            min_volume_ul=min_volume_ul,
-            max_volume_ul=max_volume_ul,
-            total_reads_m=None,  # Don't calculate expected reads at this stage
-        )
+    # Compute volumes for all sub-pools at once (pool fractions are per sub-pool)
+    df_stage1_volumes = compute_pool_volumes_grouped(
+        df_with_subpools,
+        "SubPool ID",
+        scaling_factor=scaling_factor,
+        min_volume_ul=min_volume_ul,
+        max_volume_ul=max_volume_ul,
+        total_reads_m=None,  # Don't calculate expected reads at this stage
+    )
 
-        # Store volumes with SubPool ID for tracking
-        subpool_volumes["SubPool ID"] = subpool_id
-        stage1_volumes_list.append(subpool_volumes)
+    # Row order listing each sub-pool's libraries as a contiguous block
+    # (sub-pools in first-appearance order); order[start:stop] is one sub-pool
+    subpool_codes, subpool_ids = pd.factorize(df_with_subpools["SubPool ID"])
+    order = np.argsort(subpool_codes, kind="stable")
+    bounds = np.searchsorted(subpool_codes[order], np.arange(len(subpool_ids) + 1))
 
-        # Compute sub-pool properties
-        subpool_record = compute_subpool_properties(subpool_df, subpool_volumes, subpool_id)
-        subpool_records.append(subpool_record)
+    # Compute sub-pool properties. The stage 1 frame carries both the library
+    # columns and the volumes row by row, so each slice serves as both inputs.
+    subpool_records = []
+    for subpool_id, start, stop in zip(subpool_ids, bounds[:-1], bounds[1:]):
+        subpool_volumes = df_stage1_volumes.take(order[start:stop])
+        subpool_records.append(
+            compute_subpool_properties(
+                subpool_volumes,
+                subpool_volumes,
+                subpool_id,
+                creation_date=created_at,
+                assume_aligned=True,
+            )
+        )
 
-    # Combine all stage 1 volumes
-    df_stage1_volumes = pd.concat(stage1_volumes_list, ignore_index=True)
+    # Stage 1 records, laid out sub-pool by sub-pool. The record list is
+    # reordered rather than the frame, so no reordered copy is materialized.
+    stage1_records = df_stage1_volumes.to_dict(orient="records")
+    stage1_records = [stage1_records[i] for i in order]
 
     # Create Stage 1 data
     stage1 = PoolingStageData(
@@ -354,7 +397,7 @@ def compute_hierarchical_pooling(
         stage_number=1,
         input_count=len(df),
         output_count=len(subpool_records),
-        volumes_df_json=df_stage1_volumes.to_dict(orient="records"),
+        volumes_df_json=stage1_records,
         total_pipetting_steps=len(df),
         description=f"Pool {len(df)} libraries into {len(subpool_records)} sub-pools by {grouping_column}",
         warnings=[],
@@ -362,20 +405,22 @@ def compute_hierarchical_pooling(
 
     # ========== STAGE 2: Sub-pools → Master Pool ==========
 
-    # Create DataFrame from sub-pool records (treating them as "super-libraries")
-    subpool_data = []
-    for sp in subpool_records:
-        subpool_data.append(
-            {
-                "Library Name": sp.subpool_id,
-                "Adjusted lib nM": sp.calculated_nm,
-                "Target Reads (M)": sp.target_reads_m,
-                "Total Volume": sp.total_volume_ul,
-                "Project ID": sp.parent_project_id if sp.parent_project_id else "SubPool",
-            }
-        )
-
-    df_subpools = pd.DataFrame(subpool_data)
+    # Create DataFrame from sub-pool records (treating them as "super-libraries"),
+    # built column by column with typed float arrays
+    num_subpools = len(subpool_records)
+    df_subpools = pd.DataFrame({
+        "Library Name": [sp.subpool_id for sp in subpool_records],
+        "Adjusted lib nM": np.fromiter(
+            (sp.calculated_nm for sp in subpool_records), dtype=np.float64, count=num_subpools
+        ),
+        "Target Reads (M)": np.fromiter(
+            (sp.target_reads_m for sp in subpool_records), dtype=np.float64, count=num_subpools
+        ),
+        "Total Volume": np.fromiter(
+            (sp.total_volume_ul for sp in subpool_records), dtype=np.float64, count=num_subpools
+        ),
+        "Project ID": [sp.parent_project_id or "SubPool" for sp in subpool_records],
+    })
 
     # Compute volumes for combining sub-pools into master pool
     df_stage2_volumes = compute_pool_volumes(
@@ -409,7 +454,7 @@ def compute_hierarchical_pooling(
         total_subpools=len(subpool_records),
         strategy="hierarchical",
         grouping_method=grouping_column,
-        created_at=datetime.now(),
+        created_at=created_at,
         parameters={
             "scaling_factor": scaling_factor,
             "min_volume_ul": min_volume_ul,
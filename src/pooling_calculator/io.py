@@ -4,25 +4,45 @@ Input/Output operations for Pooling Calculator.
 This module handles reading spreadsheets and exporting results to Excel files.
 """
 
+from collections.abc import Iterator
 from datetime import datetime
+from importlib.util import find_spec
 from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO
 
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
 
 from pooling_calculator import __version__
 from pooling_calculator.config import (
     DEFAULT_SHEET_NAME,
+    LIBRARY_DTYPES,
     OUTPUT_LIBRARY_COLUMNS,
     OUTPUT_PROJECT_COLUMNS,
     normalize_column_name,
 )
+from pooling_calculator.models import LibraryRecord
+
+
+# pandas' multithreaded pyarrow CSV parser when pyarrow is installed
+# (pip install pooling-calculator[fast]), otherwise the default C parser
+_CSV_ENGINE = "pyarrow" if find_spec("pyarrow") is not None else "c"
+
+# Rust-backed calamine reader for .xlsx when python-calamine is installed
+# (pip install pooling-calculator[fast]), otherwise openpyxl
+_XLSX_ENGINE = "calamine" if find_spec("python_calamine") is not None else "openpyxl"
+
+# xlsxwriter in constant_memory mode for exports when installed
+# (pip install pooling-calculator[fast]), otherwise openpyxl write-only
+_XLSX_WRITER = "xlsxwriter" if find_spec("xlsxwriter") is not None else "openpyxl"
 
 
 def load_spreadsheet(
     file_path_or_bytes: str | Path | bytes | BinaryIO,
     sheet_name: str | int | None = DEFAULT_SHEET_NAME,
+    engine: str | None = None,
 ) -> pd.DataFrame:
     """
     Load a spreadsheet from file path or bytes.
@@ -30,6 +50,9 @@ def load_spreadsheet(
     Args:
         file_path_or_bytes: Path to Excel file, bytes, or file-like object
         sheet_name: Sheet name or index to read (None = first sheet, 0 = first sheet by index)
+        engine: pandas Excel engine for .xlsx input (None = "calamine" if
+            python-calamine is installed, else "openpyxl"). Neither engine
+            evaluates formulas; cached formula results are read.
 
     Returns:
         DataFrame with raw data from spreadsheet
@@ -51,15 +74,19 @@ def load_spreadsheet(
                 raise FileNotFoundError(f"File not found: {file_path}")
 
             # Detect file type by extension
-            if file_path.suffix.lower() == ".csv":
-                df = pd.read_csv(file_path)
-            else:
+            suffix = file_path.suffix.lower()
+            if suffix == ".csv":
+                df = _read_csv(file_path)
+            elif suffix == ".xls":
+                # Legacy format, left to pandas' engine detection
                 df = pd.read_excel(file_path, sheet_name=sheet_name)
+            else:
+                df = _read_xlsx(file_path, sheet_name, engine)
         elif isinstance(file_path_or_bytes, bytes):
-            df = pd.read_excel(BytesIO(file_path_or_bytes), sheet_name=sheet_name)
+            df = _read_xlsx(BytesIO(file_path_or_bytes), sheet_name, engine)
         else:
             # Assume it's a file-like object
-            df = pd.read_excel(file_path_or_bytes, sheet_name=sheet_name)
+            df = _read_xlsx(file_path_or_bytes, sheet_name, engine)
 
         # Remove completely empty rows
         df = df.dropna(how="all")
@@ -67,7 +94,7 @@ def load_spreadsheet(
         # Reset index after dropping rows
         df = df.reset_index(drop=True)
 
-        return df
+        return _apply_library_dtypes(df)
 
     except FileNotFoundError:
         raise
@@ -75,26 +102,98 @@ def load_spreadsheet(
         raise ValueError(f"Error reading Excel file: {e}") from e
 
 
-def normalize_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
+def _read_csv(file_path: Path) -> pd.DataFrame:
     """
-    Normalize column names in DataFrame using config mappings.
+    Read a CSV file, with the pyarrow parser when it is available.
+
+    pyarrow rejects rows with fewer fields than the header, which the C parser
+    pads with NaN (e.g. rows that omit trailing optional columns), so such
+    files are re-read with the C parser.
+
+    Args:
+        file_path: Path to the CSV file
+
+    Returns:
+        DataFrame with raw data from the file
+    """
+    if _CSV_ENGINE == "pyarrow":
+        try:
+            return pd.read_csv(file_path, engine="pyarrow")
+        except pd.errors.ParserError:
+            pass
+    return pd.read_csv(file_path, engine="c")
+
+
+def _read_xlsx(
+    source: Path | BinaryIO,
+    sheet_name: str | int,
+    engine: str | None = None,
+) -> pd.DataFrame:
+    """
+    Read one sheet of an .xlsx workbook.
+
+    With openpyxl, the workbook is opened read-only and values-only, so cell
+    values are streamed without building the style/formula graph and cached
+    formula results are returned. calamine always reads that way.
+
+    Args:
+        source: Path or binary file-like object
+        sheet_name: Sheet name or index to read
+        engine: pandas Excel engine (None = default for this environment)
+
+    Returns:
+        DataFrame with raw data from the sheet
+    """
+    engine = engine or _XLSX_ENGINE
+    if engine != "openpyxl":
+        return pd.read_excel(source, sheet_name=sheet_name, engine=engine)
+
+    return pd.read_excel(
+        source,
+        sheet_name=sheet_name,
+        engine="openpyxl",
+        engine_kwargs={"read_only": True, "data_only": True, "keep_links": False},
+    )
+
+
+def _apply_library_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast recognized numeric input columns to their LIBRARY_DTYPES dtype.
+
+    Headers are matched through normalize_column_name, so raw names and
+    aliases are covered while the returned frame keeps its original headers.
+    Columns that were not read as numbers (e.g. containing text such as
+    "unknown") are left as-is so validation can report the offending rows.
 
     Args:
         df: DataFrame with raw column names
 
     Returns:
-        DataFrame with normalized column names
+        DataFrame with numeric library columns stored as float64
     """
-    # Create a mapping of original → normalized names
-    column_mapping = {}
+    dtypes = {}
     for col in df.columns:
-        normalized = normalize_column_name(str(col))
-        column_mapping[col] = normalized
+        dtype = LIBRARY_DTYPES.get(normalize_column_name(str(col)))
+        if dtype is not None and df[col].dtype != dtype and pd.api.types.is_numeric_dtype(df[col]):
+            dtypes[col] = dtype
 
-    # Rename columns
-    df_normalized = df.rename(columns=column_mapping)
+    return df.astype(dtypes) if dtypes else df
 
-    return df_normalized
+
+def normalize_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize column names in DataFrame using config mappings.
+
+    Args:
+        df: DataFrame with raw column names
+
+    Returns:
+        DataFrame with normalized column names
+    """
+    # Map each header through the (memoized) normalizer and relabel in one step;
+    # set_axis returns a new frame, so the caller's columns are left untouched
+    normalized_columns = df.columns.astype(str).map(normalize_column_name)
+    return df.set_axis(normalized_columns, axis=1)
 
 
 def dataframe_to_dict_list(df: pd.DataFrame) -> list[dict]:
@@ -107,22 +206,35 @@ def dataframe_to_dict_list(df: pd.DataFrame) -> list[dict]:
     Returns:
         List of dictionaries, one per row
     """
-    # Convert to dict, handling NaN values
-    records = df.to_dict(orient="records")
-
-    # Replace NaN with None for optional fields
-    cleaned_records = []
-    for record in records:
-        cleaned = {}
-        for key, value in record.items():
-            # Check for NaN using pandas
-            if pd.isna(value):
-                cleaned[key] = None
-            else:
-                cleaned[key] = value
-        cleaned_records.append(cleaned)
+    # Replace NaN with None for optional fields in one vectorized pass
+    # (object dtype so None isn't coerced back to NaN), then build the records
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+def iter_library_records(df: pd.DataFrame) -> Iterator[LibraryRecord]:
+    """
+    Validate DataFrame rows into LibraryRecord models one at a time.
 
-    return cleaned_records
+    Equivalent to calling create_library_from_dict() on each entry of
+    dataframe_to_dict_list(df), without materializing the list of dicts.
+    Missing cells are left out so model defaults apply.
+
+    Args:
+        df: DataFrame whose column names are LibraryRecord field names
+
+    Yields:
+        Validated LibraryRecord, one per row
+
+    Raises:
+        ValidationError: If a row doesn't meet validation requirements
+    """
+    columns = [str(col) for col in df.columns]
+    present = df.notna().to_numpy()
+
+    for values, row_present in zip(df.itertuples(index=False, name=None), present):
+        yield LibraryRecord(
+            **{col: value for col, value, ok in zip(columns, values, row_present) if ok}
+        )
 
 
 def export_results_to_excel(
@@ -130,7 +242,8 @@ def export_results_to_excel(
     project_df: pd.DataFrame,
     output_path: str | Path | None = None,
     pooling_params: dict | None = None,
-) -> bytes | None:
+    return_stream: bool = False,
+) -> bytes | BytesIO | None:
     """
     Export pooling results to Excel file with multiple sheets.
 
@@ -139,9 +252,12 @@ def export_results_to_excel(
         project_df: DataFrame with per-project summary
         output_path: Optional path to save file (if None, returns bytes)
         pooling_params: Optional dictionary of pooling parameters for metadata
+        return_stream: If True and output_path is None, return the BytesIO
+            buffer (positioned at 0) instead of copying it out as bytes
 
     Returns:
-        Bytes of Excel file if output_path is None, otherwise None
+        Bytes of Excel file (or the buffer itself if return_stream) if
+        output_path is None, otherwise None
     """
     # Create BytesIO buffer or use file path
     if output_path is None:
@@ -150,32 +266,24 @@ def export_results_to_excel(
     else:
         writer_target = Path(output_path)
 
-    # Create Excel writer
-    with pd.ExcelWriter(writer_target, engine="openpyxl") as writer:
-        # Write library-level results
-        library_df.to_excel(
-            writer, sheet_name="PoolingPlan_Libraries", index=False, freeze_panes=(1, 0)
-        )
-
-        # Write project-level summary
-        project_df.to_excel(
-            writer, sheet_name="PoolingPlan_Projects", index=False, freeze_panes=(1, 0)
-        )
+    # Metadata sheet
+    metadata = _create_metadata_dict(pooling_params)
 
-        # Write metadata sheet
-        metadata = _create_metadata_dict(pooling_params)
-        metadata_df = pd.DataFrame(list(metadata.items()), columns=["Parameter", "Value"])
-        metadata_df.to_excel(writer, sheet_name="Metadata", index=False, freeze_panes=(1, 0))
-
-        # Auto-adjust column widths
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-            _auto_adjust_column_widths(worksheet)
+    # Write library-level results, project-level summary and metadata
+    _write_excel_sheets(
+        writer_target,
+        {
+            "PoolingPlan_Libraries": library_df,
+            "PoolingPlan_Projects": project_df,
+        },
+        list(metadata.items()),
+    )
 
     # Return bytes if no output path specified
     if output_path is None:
         buffer.seek(0)
-        return buffer.getvalue()
+        # Hand back the buffer itself to skip the full-size getvalue() copy
+        return buffer if return_stream else buffer.getvalue()
     else:
         return None
 
@@ -224,27 +332,159 @@ def _create_metadata_dict(pooling_params: dict | None = None) -> dict[str, str]:
     return metadata
 
 
-def _auto_adjust_column_widths(worksheet) -> None:
+def _write_excel_sheets(
+    target: BytesIO | Path,
+    sheets: dict[str, pd.DataFrame],
+    metadata_items: list[tuple[str, str]],
+) -> None:
     """
-    Auto-adjust column widths in an openpyxl worksheet.
+    Write DataFrames to an Excel workbook, one sheet per DataFrame.
+
+    Rows are streamed out as they are written instead of being kept in
+    memory: xlsxwriter's constant_memory mode when available, otherwise an
+    openpyxl write-only workbook. Each sheet has a frozen header row and
+    column widths sized to its contents.
 
     Args:
-        worksheet: openpyxl worksheet object
+        target: Buffer or file path to save the workbook to
+        sheets: Mapping of sheet name → DataFrame, in sheet order
+        metadata_items: (parameter, value) rows for the trailing Metadata
+            sheet, written directly without building a DataFrame
     """
-    for column in worksheet.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
+    contents = _iter_sheet_contents(sheets, metadata_items)
+    if _XLSX_WRITER == "xlsxwriter":
+        _write_sheets_xlsxwriter(target, contents)
+    else:
+        _write_sheets_openpyxl(target, contents)
 
-        for cell in column:
-            try:
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
-            except:
-                pass
+
+def _iter_sheet_contents(
+    sheets: dict[str, pd.DataFrame],
+    metadata_items: list[tuple[str, str]],
+) -> Iterator[tuple[str, list[int], Iterator[tuple]]]:
+    """
+    Yield (sheet name, column widths, rows) for each sheet to be written.
+
+    DataFrame sheets come first, in order, followed by the Metadata sheet.
+    """
+    for sheet_name, df in sheets.items():
+        yield sheet_name, _compute_column_widths(df), _iter_sheet_rows(df)
+
+    metadata_rows = [("Parameter", "Value"), *metadata_items]
+    yield "Metadata", _compute_row_widths(metadata_rows), iter(metadata_rows)
+
+
+def _write_sheets_xlsxwriter(
+    target: BytesIO | Path,
+    contents: Iterator[tuple[str, list[int], Iterator[tuple]]],
+) -> None:
+    """Write sheets with xlsxwriter in constant_memory mode."""
+    import xlsxwriter
+
+    # constant_memory flushes each row once the next one starts, so rows are
+    # written strictly in order rather than through pd.ExcelWriter, which
+    # emits cells column by column
+    workbook = xlsxwriter.Workbook(
+        target if isinstance(target, BytesIO) else str(target),
+        {"constant_memory": True, "default_date_format": "yyyy-mm-dd hh:mm:ss"},
+    )
+
+    for sheet_name, widths, rows in contents:
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.freeze_panes(1, 0)
+
+        for col_idx, width in enumerate(widths):
+            worksheet.set_column(col_idx, col_idx, width)
+
+        for row_idx, row in enumerate(rows):
+            worksheet.write_row(row_idx, 0, row)
+
+    workbook.close()
+
+
+def _write_sheets_openpyxl(
+    target: BytesIO | Path,
+    contents: Iterator[tuple[str, list[int], Iterator[tuple]]],
+) -> None:
+    """Write sheets with an openpyxl write-only workbook."""
+    workbook = Workbook(write_only=True)
+
+    for sheet_name, widths, rows in contents:
+        worksheet = workbook.create_sheet(title=sheet_name)
+        worksheet.freeze_panes = "A2"
+
+        # Write-only sheets can't be read back, so widths come from the data
+        # and must be set before any rows are written
+        for col_idx, width in enumerate(widths, start=1):
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = width
+
+        for row in rows:
+            worksheet.append(row)
+
+    workbook.save(target)
+
+
+def _iter_sheet_rows(df: pd.DataFrame) -> Iterator[tuple]:
+    """
+    Yield the header row and then each data row of a DataFrame.
+
+    Missing values are yielded as None so they are written as empty cells.
+    Infinite values are yielded as the text "inf" / "-inf", matching
+    DataFrame.to_excel's default inf_rep, since neither writer can store
+    them as numbers.
+    """
+    yield tuple(str(col) for col in df.columns)
+
+    values = df.astype(object).where(df.notna(), None)
+    infinite = df.isin([float("inf"), float("-inf")])
+    if infinite.to_numpy().any():
+        values = values.mask(infinite, values.map(str))
+    yield from values.itertuples(index=False, name=None)
+
+
+def _compute_row_widths(rows: list[tuple]) -> list[int]:
+    """
+    Compute Excel column widths for a small sheet given as rows.
+
+    Uses the same sizing rule as _compute_column_widths.
+
+    Args:
+        rows: Header row followed by data rows
+
+    Returns:
+        List of column widths, in column order
+    """
+    return [
+        min(max(len(str(value)) for value in column if value is not None) + 2, 50)
+        for column in zip(*rows)
+    ]
+
+
+def _compute_column_widths(df: pd.DataFrame) -> list[int]:
+    """
+    Compute Excel column widths from DataFrame contents.
+
+    Each width fits the longest header or non-missing value, plus padding.
+    Only distinct values are converted to strings, since columns such as
+    Project ID and Flags repeat the same few values across many rows.
+
+    Args:
+        df: DataFrame to be written to a sheet
+
+    Returns:
+        List of column widths, in column order
+    """
+    widths = []
+    for col_idx, col in enumerate(df.columns):
+        values = df.iloc[:, col_idx].dropna().drop_duplicates()
+        max_length = len(str(col))
+        if len(values) > 0:
+            max_length = max(max_length, int(values.astype(str).str.len().max()))
 
         # Set width with some padding
-        adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-        worksheet.column_dimensions[column_letter].width = adjusted_width
+        widths.append(min(max_length + 2, 50))  # Cap at 50 characters
+
+    return widths
 
 
 def create_library_dataframe_for_export(libraries: list[dict]) -> pd.DataFrame:
@@ -259,29 +499,24 @@ def create_library_dataframe_for_export(libraries: list[dict]) -> pd.DataFrame:
     """
     df = pd.DataFrame(libraries)
 
+    # Derived columns are collected first and added in a single assign, so the
+    # frame is copied once rather than grown column by column
+    derived = {}
+
     # Format pool fraction BEFORE reordering (while pool_fraction column still exists)
     if "pool_fraction" in df.columns:
-        df["Pool Fraction (%)"] = df["pool_fraction"] * 100
+        derived["Pool Fraction (%)"] = df["pool_fraction"].to_numpy() * 100
 
     # Format flags column (convert list to comma-separated string) - handle both lowercase and title case
-    if "flags" in df.columns:
-        df["Flags"] = df["flags"].apply(
-            lambda x: ", ".join(x) if isinstance(x, list) else (str(x) if x is not None else "")
-        )
-    elif "Flags" in df.columns:
-        df["Flags"] = df["Flags"].apply(
-            lambda x: ", ".join(x) if isinstance(x, list) else (str(x) if x is not None else "")
-        )
-
-    # Ensure we have all expected columns (add missing ones as NaN)
-    for col in OUTPUT_LIBRARY_COLUMNS:
-        if col not in df.columns:
-            df[col] = None
-
-    # Reorder columns to match expected output
-    df = df[OUTPUT_LIBRARY_COLUMNS]
+    flags_source = "flags" if "flags" in df.columns else "Flags"
+    if flags_source in df.columns:
+        derived["Flags"] = [
+            ", ".join(x) if isinstance(x, list) else (str(x) if x is not None else "")
+            for x in df[flags_source].to_numpy()
+        ]
 
-    return df
+    # Select columns in the expected output order, adding missing ones as NaN
+    return df.assign(**derived).reindex(columns=OUTPUT_LIBRARY_COLUMNS)
 
 
 def create_project_dataframe_for_export(projects: list[dict]) -> pd.DataFrame:
@@ -296,19 +531,13 @@ def create_project_dataframe_for_export(projects: list[dict]) -> pd.DataFrame:
     """
     df = pd.DataFrame(projects)
 
-    # Ensure we have all expected columns
-    for col in OUTPUT_PROJECT_COLUMNS:
-        if col not in df.columns:
-            df[col] = None
-
     # Format pool fraction BEFORE reordering (while pool_fraction column still exists)
+    derived = {}
     if "pool_fraction" in df.columns:
-        df["Pool Fraction (%)"] = df["pool_fraction"] * 100
-
-    # Reorder columns
-    df = df[OUTPUT_PROJECT_COLUMNS]
+        derived["Pool Fraction (%)"] = df["pool_fraction"].to_numpy() * 100
 
-    return df
+    # Select columns in the expected output order, adding missing ones as NaN
+    return df.assign(**derived).reindex(columns=OUTPUT_PROJECT_COLUMNS)
 
 
 def export_prepooling_results_to_excel(
@@ -318,7 +547,8 @@ def export_prepooling_results_to_excel(
     prepool_plan: "PrePoolingPlan",
     output_path: str | Path | None = None,
     pooling_params: dict | None = None,
-) -> bytes | None:
+    return_stream: bool = False,
+) -> bytes | BytesIO | None:
     """
     Export pre-pooling results to Excel file with separate sheets.
 
@@ -335,9 +565,12 @@ def export_prepooling_results_to_excel(
         prepool_plan: PrePoolingPlan object with complete results
         output_path: Optional path to save file (if None, returns bytes)
         pooling_params: Optional dictionary of pooling parameters
+        return_stream: If True and output_path is None, return the BytesIO
+            buffer (positioned at 0) instead of copying it out as bytes
 
     Returns:
-        Bytes of Excel file if output_path is None, otherwise None
+        Bytes of Excel file (or the buffer itself if return_stream) if
+        output_path is None, otherwise None
     """
     # Create BytesIO buffer or use file path
     if output_path is None:
@@ -346,39 +579,23 @@ def export_prepooling_results_to_excel(
     else:
         writer_target = Path(output_path)
 
-    # Create Excel writer
-    with pd.ExcelWriter(writer_target, engine="openpyxl") as writer:
-        # Write Final Pool sheet
-        final_pool_df.to_excel(
-            writer, sheet_name="Final Pool", index=False, freeze_panes=(1, 0)
-        )
-
-        # Write Prepool 1 sheet if it exists
-        if prepool1_df is not None and not prepool1_df.empty:
-            prepool1_df.to_excel(
-                writer, sheet_name="Prepool 1", index=False, freeze_panes=(1, 0)
-            )
+    # Final Pool sheet, then prepool sheets if they exist
+    sheets = {"Final Pool": final_pool_df}
+    if prepool1_df is not None and not prepool1_df.empty:
+        sheets["Prepool 1"] = prepool1_df
+    if prepool2_df is not None and not prepool2_df.empty:
+        sheets["Prepool 2"] = prepool2_df
 
-        # Write Prepool 2 sheet if it exists
-        if prepool2_df is not None and not prepool2_df.empty:
-            prepool2_df.to_excel(
-                writer, sheet_name="Prepool 2", index=False, freeze_panes=(1, 0)
-            )
+    # Metadata sheet with prepool information
+    metadata_items = _create_prepooling_metadata_list(prepool_plan, pooling_params)
 
-        # Write metadata sheet with prepool information
-        metadata_items = _create_prepooling_metadata_list(prepool_plan, pooling_params)
-        metadata_df = pd.DataFrame(metadata_items, columns=["Parameter", "Value"])
-        metadata_df.to_excel(writer, sheet_name="Metadata", index=False, freeze_panes=(1, 0))
-
-        # Auto-adjust column widths for all sheets
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-            _auto_adjust_column_widths(worksheet)
+    _write_excel_sheets(writer_target, sheets, metadata_items)
 
     # Return bytes if no output path specified
     if output_path is None:
         buffer.seek(0)
-        return buffer.getvalue()
+        # Hand back the buffer itself to skip the full-size getvalue() copy
+        return buffer if return_stream else buffer.getvalue()
     else:
         return None
 
@@ -410,25 +627,28 @@ def _create_prepooling_metadata_list(
         ("Number of Pre-pools", str(len(prepool_plan.prepools))),
     ]
 
-    # Add prepool-specific information
+    # Add prepool-specific information, one block of rows per prepool
     for i, prepool_result in enumerate(prepool_plan.prepools, 1):
-        metadata_items.append(("", ""))  # Blank row
-        metadata_items.append((f"Pre-pool {i} Name", prepool_result.prepool_definition.prepool_name))
-        metadata_items.append((f"Pre-pool {i} Members", str(len(prepool_result.prepool_definition.member_library_names))))
-        metadata_items.append((f"Pre-pool {i} Concentration (nM)", f"{prepool_result.calculated_nm:.3f}"))
-        metadata_items.append((f"Pre-pool {i} Total Volume (µl)", f"{prepool_result.total_volume_ul:.3f}"))
-        metadata_items.append((f"Pre-pool {i} Target Reads (M)", f"{prepool_result.target_reads_m:.2f}"))
+        definition = prepool_result.prepool_definition
+        metadata_items += [
+            ("", ""),  # Blank row
+            (f"Pre-pool {i} Name", definition.prepool_name),
+            (f"Pre-pool {i} Members", str(len(definition.member_library_names))),
+            (f"Pre-pool {i} Concentration (nM)", f"{prepool_result.calculated_nm:.3f}"),
+            (f"Pre-pool {i} Total Volume (µl)", f"{prepool_result.total_volume_ul:.3f}"),
+            (f"Pre-pool {i} Target Reads (M)", f"{prepool_result.target_reads_m:.2f}"),
+        ]
 
     # Add pooling parameters if provided
     if pooling_params:
-        metadata_items.append(("", ""))  # Blank row
-        metadata_items.append(("Scaling Factor", str(pooling_params.get("Scaling Factor", "N/A"))))
-        metadata_items.append(("Min Volume (µl)", str(pooling_params.get("Min Volume (µl)", "N/A"))))
-
         max_vol = pooling_params.get("Max Volume (µl)")
-        metadata_items.append(("Max Volume (µl)", str(max_vol) if max_vol and max_vol != "N/A" else "None"))
-
         total_reads = pooling_params.get("Total Reads (M)")
-        metadata_items.append(("Total Reads (M)", str(total_reads) if total_reads and total_reads != "N/A" else "None"))
+        metadata_items += [
+            ("", ""),  # Blank row
+            ("Scaling Factor", str(pooling_params.get("Scaling Factor", "N/A"))),
+            ("Min Volume (µl)", str(pooling_params.get("Min Volume (µl)", "N/A"))),
+            ("Max Volume (µl)", str(max_vol) if max_vol and max_vol != "N/A" else "None"),
+            ("Total Reads (M)", str(total_reads) if total_reads and total_reads != "N/A" else "None"),
+        ]
 
     return metadata_items
@@ -5,10 +5,12 @@ This module defines the core data structures used throughout the application,
 with runtime validation and type safety provided by Pydantic.
 """
 
+import sys
+from collections.abc import Iterator
 from datetime import datetime
 from enum import Enum
 from typing import Any
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
 
 
 # ============================================================================
@@ -32,13 +34,18 @@ class LibraryRecord(BaseModel):
     empirical_nm: float | None = Field(None, gt=0, description="Optional qPCR-measured molarity in nM")
     target_reads_m: float = Field(..., gt=0, description="Target read allocation in millions")
 
-    @field_validator("project_id", "library_name", "barcode")
+    @field_validator("project_id")
     @classmethod
-    def strip_whitespace(cls, v: str) -> str:
-        """Strip leading/trailing whitespace from string fields."""
-        return v.strip()
+    def intern_project_id(cls, v: str) -> str:
+        """Intern project_id so the many rows sharing a project share one string object."""
+        return sys.intern(v)
 
+    # String fields are stripped by pydantic-core (str_strip_whitespace)
+    # before length checks, without a Python validator call per field
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
+        "str_strip_whitespace": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -71,6 +78,8 @@ class LibraryWithComputedFields(LibraryRecord):
     flags: list[str] = Field(default_factory=list, description="Validation warnings/errors")
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -113,6 +122,8 @@ class ProjectSummary(BaseModel):
     expected_reads_m: float | None = Field(None, ge=0, description="Expected total reads (millions)")
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -155,6 +166,8 @@ class PoolingParams(BaseModel):
         return v
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -188,12 +201,12 @@ class ValidationResult(BaseModel):
     @property
     def has_errors(self) -> bool:
         """Check if there are any errors."""
-        return len(self.errors) > 0
+        return bool(self.errors)
 
     @property
     def has_warnings(self) -> bool:
         """Check if there are any warnings."""
-        return len(self.warnings) > 0
+        return bool(self.warnings)
 
     def add_error(self, message: str) -> None:
         """Add an error message."""
@@ -211,28 +224,26 @@ class ValidationResult(BaseModel):
         Returns:
             Formatted string with errors, warnings, and summary
         """
-        lines = []
+        return "\n".join(self._report_lines())
 
-        if self.has_errors:
-            lines.append("ERRORS:")
-            for error in self.errors:
-                lines.append(f"  - {error}")
-            lines.append("")
+    def _report_lines(self) -> Iterator[str]:
+        """Yield the lines of the report, section by section."""
+        if self.errors:
+            yield "ERRORS:"
+            yield from (f"  - {error}" for error in self.errors)
+            yield ""
 
-        if self.has_warnings:
-            lines.append("WARNINGS:")
-            for warning in self.warnings:
-                lines.append(f"  - {warning}")
-            lines.append("")
+        if self.warnings:
+            yield "WARNINGS:"
+            yield from (f"  - {warning}" for warning in self.warnings)
+            yield ""
 
         if self.summary:
-            lines.append("SUMMARY:")
-            for key, value in self.summary.items():
-                lines.append(f"  {key}: {value}")
-
-        return "\n".join(lines)
+            yield "SUMMARY:"
+            yield from (f"  {key}: {value}" for key, value in self.summary.items())
 
     model_config = {
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -257,6 +268,10 @@ class ValidationResult(BaseModel):
 # ============================================================================
 
 
+# Built once; reused for every bulk validation
+_LIBRARY_LIST_ADAPTER = TypeAdapter(list[LibraryRecord])
+
+
 def create_library_from_dict(data: dict[str, Any]) -> LibraryRecord:
     """
     Create a LibraryRecord from a dictionary (e.g., from DataFrame row).
@@ -273,6 +288,26 @@ def create_library_from_dict(data: dict[str, Any]) -> LibraryRecord:
     return LibraryRecord(**data)
 
 
+def create_libraries_from_dicts(records: list[dict[str, Any]]) -> list[LibraryRecord]:
+    """
+    Create LibraryRecords from a list of dictionaries in one validation call.
+
+    Equivalent to [create_library_from_dict(r) for r in records], but the
+    whole list is validated by pydantic-core in a single pass.
+
+    Args:
+        records: List of dictionaries with library data
+
+    Returns:
+        List of validated LibraryRecord instances
+
+    Raises:
+        ValidationError: If any record doesn't meet validation requirements
+            (errors are reported for all failing records, by list index)
+    """
+    return _LIBRARY_LIST_ADAPTER.validate_python(records)
+
+
 def create_pooling_params(
     pool_volume: float,
     min_volume: float = 1.0,
@@ -335,13 +370,10 @@ class SubPoolRecord(BaseModel):
     parent_project_id: str | None = Field(None, description="Project ID if grouped by project")
     custom_grouping: dict[str, Any] | None = Field(None, description="Custom grouping metadata")
 
-    @field_validator("subpool_id")
-    @classmethod
-    def strip_whitespace_subpool_id(cls, v: str) -> str:
-        """Strip leading/trailing whitespace from subpool_id."""
-        return v.strip()
-
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
+        "str_strip_whitespace": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -381,6 +413,8 @@ class PoolingStageData(BaseModel):
     warnings: list[str] = Field(default_factory=list, description="Warnings generated during this stage")
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -427,21 +461,15 @@ class HierarchicalPoolingPlan(BaseModel):
     @classmethod
     def stages_must_be_sequential(cls, v: list[PoolingStageData]) -> list[PoolingStageData]:
         """Validate that stage numbers are sequential starting from 1."""
-        if not v:
+        if all(stage.stage_number == expected for expected, stage in enumerate(v, 1)):
             return v
 
-        expected_stage_num = 1
-        for stage in v:
-            if stage.stage_number != expected_stage_num:
-                raise ValueError(
-                    f"Stage numbers must be sequential. Expected {expected_stage_num}, "
-                    f"got {stage.stage_number}"
-                )
-            expected_stage_num += 1
-
-        return v
+        stage_numbers = [stage.stage_number for stage in v]
+        raise ValueError(f"Stage numbers must be sequential starting from 1, got {stage_numbers}")
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -481,21 +509,19 @@ class PrePoolDefinition(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now, description="When this pre-pool was defined")
     notes: str | None = Field(None, description="Optional notes about this pre-pool")
 
-    @field_validator("prepool_id", "prepool_name")
-    @classmethod
-    def strip_whitespace_prepool(cls, v: str) -> str:
-        """Strip leading/trailing whitespace."""
-        return v.strip()
-
     @field_validator("member_library_names")
     @classmethod
     def validate_unique_libraries(cls, v: list[str]) -> list[str]:
         """Ensure no duplicate library names within a pre-pool."""
         if len(v) != len(set(v)):
             raise ValueError("Duplicate library names found in member_library_names")
-        return [lib.strip() for lib in v]
+        return v
 
+    # String fields, including member names, are stripped by pydantic-core
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
+        "str_strip_whitespace": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -525,6 +551,8 @@ class PrePoolCalculationResult(BaseModel):
     member_volumes_json: list[dict[str, Any]] = Field(..., description="Per-library volumes within prepool (JSON)")
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -583,6 +611,8 @@ class PrePoolingPlan(BaseModel):
         return self
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -14,7 +14,9 @@ Workflow:
 5. Calculate final pool with both pre-pools and standalone libraries
 """
 
+import numpy as np
 import pandas as pd
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
@@ -31,6 +33,10 @@ from pooling_calculator.compute import compute_pool_volumes
 # ============================================================================
 
 
+# Columns needed to compute a pre-pool from its member libraries
+_PREPOOL_REQUIRED_COLUMNS = ("Library Name", "Adjusted lib nM", "Target Reads (M)")
+
+
 def create_prepool_from_selection(
     df: pd.DataFrame,
     selected_library_names: list[str],
@@ -38,6 +44,8 @@ def create_prepool_from_selection(
     scaling_factor: float,
     min_volume_ul: float,
     max_volume_ul: float | None,
+    library_positions: dict[str, int] | None = None,
+    created_at: datetime | None = None,
 ) -> PrePoolCalculationResult:
     """
     Calculate pooling volumes for a user-defined pre-pool.
@@ -50,6 +58,10 @@ def create_prepool_from_selection(
         scaling_factor: Volume calculation parameter
         min_volume_ul: Minimum pipettable volume
         max_volume_ul: Maximum volume constraint (optional)
+        library_positions: Library Name → row position in df, as built by
+            _library_positions(df); built here if not given. Pass it when
+            creating several pre-pools from the same df.
+        created_at: Timestamp for the pre-pool definition (default: now)
 
     Returns:
         PrePoolCalculationResult with volumes and calculated properties
@@ -57,6 +69,7 @@ def create_prepool_from_selection(
     Raises:
         ValueError: If selected libraries not found in DataFrame
         ValueError: If DataFrame missing required columns
+        ValueError: If the pre-pool volume, molarity or target reads is not positive
 
     Logic:
         1. Filter df to selected libraries
@@ -69,13 +82,20 @@ def create_prepool_from_selection(
         4. Return wrapped result
     """
     # Validate required columns
-    required_cols = ["Library Name", "Adjusted lib nM", "Target Reads (M)"]
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in _PREPOOL_REQUIRED_COLUMNS if col not in df.columns]
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
 
-    # Filter to selected libraries
-    selected_df = df[df["Library Name"].isin(selected_library_names)].copy()
+    # Filter to selected libraries by looking up their row positions, kept in
+    # df order with each row taken once
+    if library_positions is None:
+        library_positions = _library_positions(df)
+
+    positions = np.unique(np.fromiter(
+        (library_positions[name] for name in selected_library_names if name in library_positions),
+        dtype=np.int64,
+    ))
+    selected_df = df.iloc[positions]
 
     if len(selected_df) == 0:
         raise ValueError(f"No libraries found matching selection: {selected_library_names}")
@@ -95,48 +115,121 @@ def create_prepool_from_selection(
         total_reads_m=None,  # Don't calculate expected reads within pre-pool
     )
 
-    # Calculate pre-pool properties
+    # Calculate pre-pool properties on the underlying arrays
+    volumes_ul = prepool_volumes_df["Final Volume (µl)"].to_numpy(dtype=np.float64, na_value=np.nan)
+    target_reads = prepool_volumes_df["Target Reads (M)"].to_numpy(dtype=np.float64, na_value=np.nan)
+
     # Step 1: Total volume (sum of all member volumes)
-    total_volume_ul = prepool_volumes_df["Final Volume (µl)"].sum()
+    total_volume_ul = float(np.nansum(volumes_ul))
 
     # Step 2: Calculate prepool concentration using reference spreadsheet method
     # Per user feedback from 7050I_miRNA_pool_copy.xlsx:
     # - adj lib pmol = Target Reads (M) / 10 (desired relative picomole contribution)
     # - Prepool nM = sum(adj lib pmol) / sum(pool volumes)
     # This ensures the prepool concentration reflects the weighted target reads
-    prepool_volumes_df["adj lib pmol"] = prepool_volumes_df["Target Reads (M)"] / 10.0
-    total_pmol = prepool_volumes_df["adj lib pmol"].sum()
+    adj_lib_pmol = target_reads / 10.0
+    total_pmol = np.nansum(adj_lib_pmol)
+
+    # Kept on the member table, which is exported with the pre-pool
+    prepool_volumes_df["adj lib pmol"] = adj_lib_pmol
 
     # Step 3: Pre-pool effective concentration
-    calculated_nm = total_pmol / total_volume_ul if total_volume_ul > 0 else 0.0
+    calculated_nm = float(total_pmol / total_volume_ul) if total_volume_ul > 0 else 0.0
 
     # Step 4: Sum target reads from all members
-    target_reads_m = prepool_volumes_df["Target Reads (M)"].sum()
+    target_reads_m = float(np.nansum(target_reads))
 
-    # Create PrePoolDefinition
+    # The definition holds user-supplied names, so it is fully validated
+    # (stripping, non-empty, unique members)
     prepool_def = PrePoolDefinition(
         prepool_id=prepool_name.lower().replace(" ", "_"),
         prepool_name=prepool_name,
         member_library_names=selected_library_names,
-        created_at=datetime.now(),
+        created_at=created_at if created_at is not None else datetime.now(),
         notes=None,
     )
 
+    # The result wraps that definition and the values computed above, so it
+    # is built without re-running Pydantic validation; its gt=0 constraints
+    # are checked here instead ("not > 0" so NaN is rejected too)
+    if not (total_volume_ul > 0 and calculated_nm > 0 and target_reads_m > 0):
+        raise ValueError(
+            f"Pre-pool '{prepool_name}' must have positive volume, molarity and target reads"
+        )
+
     # Return result
-    return PrePoolCalculationResult(
+    return PrePoolCalculationResult.model_construct(
         prepool_definition=prepool_def,
         calculated_nm=calculated_nm,
         total_volume_ul=total_volume_ul,
         target_reads_m=target_reads_m,
-        member_volumes_json=prepool_volumes_df.to_dict(orient="records"),
+        member_volumes_json=_frame_records(prepool_volumes_df),
     )
 
 
+def _library_positions(df: pd.DataFrame) -> dict[str, int]:
+    """
+    Map each Library Name in df to its row position.
+
+    Args:
+        df: Library DataFrame with a "Library Name" column
+
+    Returns:
+        Dictionary of library name → positional row index
+    """
+    return {name: i for i, name in enumerate(df["Library Name"].to_numpy())}
+
+
+def _frame_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """
+    Convert a DataFrame to a list of row dictionaries.
+
+    Gives the same records as df.to_dict(orient="records"). Plain NumPy
+    numeric and bool columns, and NaN-backed str columns, are converted to
+    Python scalars with one tolist() call each; every other dtype (nullable,
+    datetime, object, categorical, ...) is boxed by pandas' to_dict as usual.
+
+    Args:
+        df: DataFrame to convert
+
+    Returns:
+        List of dictionaries, one per row, keyed by column name
+    """
+    if len(df) == 0:
+        return []
+
+    columns = list(df.columns)
+    column_values: list[Any] = [None] * len(columns)
+    boxed_positions = []
+
+    for pos, (_, values) in enumerate(df.items()):
+        dtype = values.dtype
+        if (isinstance(dtype, np.dtype) and dtype.kind in "biuf") or (
+            isinstance(dtype, pd.StringDtype) and dtype.na_value is np.nan
+        ):
+            column_values[pos] = values.to_numpy().tolist()
+        else:
+            boxed_positions.append(pos)
+
+    if boxed_positions:
+        boxed_rows = df.iloc[:, boxed_positions].to_dict(orient="split")["data"]
+        for pos, values in zip(boxed_positions, zip(*boxed_rows)):
+            column_values[pos] = values
+
+    return [dict(zip(columns, row)) for row in zip(*column_values)]
+
+
 # ============================================================================
 # Pre-Pooling Workflow
 # ============================================================================
 
 
+# Columns needed for the full workflow, and the columns the final pool is
+# built from (standalone libraries and pre-pool super-libraries alike)
+_WORKFLOW_REQUIRED_COLUMNS = _PREPOOL_REQUIRED_COLUMNS + ("Total Volume",)
+_FINAL_POOL_COLUMNS = _WORKFLOW_REQUIRED_COLUMNS + ("Project ID",)
+
+
 def compute_with_prepools(
     df: pd.DataFrame,
     prepool_definitions: list[PrePoolDefinition],
@@ -194,24 +287,21 @@ def compute_with_prepools(
     if not prepool_definitions:
         raise ValueError("At least one pre-pool definition required")
 
-    required_cols = ["Library Name", "Adjusted lib nM", "Target Reads (M)", "Total Volume"]
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in _WORKFLOW_REQUIRED_COLUMNS if col not in df.columns]
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
 
     # Step 1: Validate no overlapping libraries
-    all_prepool_libraries = []
-    for prepool_def in prepool_definitions:
-        all_prepool_libraries.extend(prepool_def.member_library_names)
-
-    if len(all_prepool_libraries) != len(set(all_prepool_libraries)):
-        # Find duplicates
-        from collections import Counter
-        counts = Counter(all_prepool_libraries)
-        duplicates = [lib for lib, count in counts.items() if count > 1]
+    libraries_in_prepools, duplicates = _split_duplicates(
+        name for prepool_def in prepool_definitions for name in prepool_def.member_library_names
+    )
+    if duplicates:
         raise ValueError(f"Libraries appear in multiple pre-pools: {duplicates}")
 
-    # Step 2: Calculate each pre-pool
+    # Step 2: Calculate each pre-pool, sharing one name → row lookup and one
+    # timestamp for every record in this plan
+    library_positions = _library_positions(df)
+    created_at = datetime.now()
     prepool_results = []
     for prepool_def in prepool_definitions:
         result = create_prepool_from_selection(
@@ -221,35 +311,33 @@ def compute_with_prepools(
             scaling_factor=scaling_factor,
             min_volume_ul=min_volume_ul,
             max_volume_ul=max_volume_ul,
+            library_positions=library_positions,
+            created_at=created_at,
         )
         prepool_results.append(result)
 
     # Step 3: Identify remaining libraries (not in any pre-pool)
-    libraries_in_prepools = set(all_prepool_libraries)
-    all_libraries = set(df["Library Name"])
-    remaining_library_names = all_libraries - libraries_in_prepools
-
-    remaining_df = df[df["Library Name"].isin(remaining_library_names)].copy()
+    remaining_mask = ~df["Library Name"].isin(libraries_in_prepools)
+    remaining_df = df[remaining_mask]
+    standalone_count = int(remaining_mask.sum())
 
     # Step 4: Create "super-libraries" from pre-pools
-    prepool_rows = []
-    for result in prepool_results:
-        prepool_rows.append({
-            "Library Name": result.prepool_definition.prepool_id,
-            "Adjusted lib nM": result.calculated_nm,
-            "Target Reads (M)": result.target_reads_m,
-            "Total Volume": result.total_volume_ul,
-            "Project ID": "PrePool",  # Mark as pre-pool
-        })
-
-    df_prepools = pd.DataFrame(prepool_rows)
+    df_prepools = pd.DataFrame({
+        "Library Name": [result.prepool_definition.prepool_id for result in prepool_results],
+        "Adjusted lib nM": np.array([result.calculated_nm for result in prepool_results], dtype=np.float64),
+        "Target Reads (M)": np.array([result.target_reads_m for result in prepool_results], dtype=np.float64),
+        "Total Volume": np.array([result.total_volume_ul for result in prepool_results], dtype=np.float64),
+        "Project ID": "PrePool",  # Mark as pre-pool
+    })
 
     # Step 5: Combine remaining libraries + pre-pools
-    if len(remaining_df) > 0:
-        # Ensure both have same columns for concat
-        common_cols = ["Library Name", "Adjusted lib nM", "Target Reads (M)", "Total Volume", "Project ID"]
-        remaining_subset = remaining_df[common_cols].copy()
-        combined_df = pd.concat([remaining_subset, df_prepools], ignore_index=True)
+    # Each shared column is joined into one array, allocated once, instead of
+    # concatenating the two frames block by block
+    if standalone_count > 0:
+        combined_df = pd.DataFrame({
+            col: np.concatenate([remaining_df[col].to_numpy(), df_prepools[col].to_numpy()])
+            for col in _FINAL_POOL_COLUMNS
+        })
     else:
         combined_df = df_prepools
 
@@ -265,12 +353,12 @@ def compute_with_prepools(
     # Step 7: Build PrePoolingPlan
     return PrePoolingPlan(
         prepools=prepool_results,
-        remaining_libraries_json=remaining_df.to_dict(orient="records") if len(remaining_df) > 0 else [],
-        final_pool_json=final_pool_df.to_dict(orient="records"),
+        remaining_libraries_json=remaining_df.to_dict(orient="records") if standalone_count > 0 else [],
+        final_pool_json=_frame_records(final_pool_df),
         total_libraries=len(df),
         libraries_in_prepools=len(libraries_in_prepools),
-        standalone_libraries=len(remaining_library_names),
-        created_at=datetime.now(),
+        standalone_libraries=standalone_count,
+        created_at=created_at,
         parameters={
             "scaling_factor": scaling_factor,
             "min_volume_ul": min_volume_ul,
@@ -310,38 +398,71 @@ def validate_prepool_definitions(
     if not prepool_definitions:
         return True, []
 
-    # Check 1: All libraries exist
-    all_libraries = set(df["Library Name"])
+    # Walk the definitions once, collecting each kind of problem; messages are
+    # reported grouped by check, in the order below
+    empty_errors = []
+    seen_libraries: set[str] = set()
+    duplicate_libraries: dict[str, None] = {}
+    seen_ids: set[str] = set()
+    duplicate_ids: dict[str, None] = {}
+
     for prepool_def in prepool_definitions:
+        # Check 3: Each pre-pool has libraries
+        if not prepool_def.member_library_names:
+            empty_errors.append(f"Pre-pool '{prepool_def.prepool_name}' has no libraries")
+
+        # Check 4: Unique pre-pool IDs
+        if prepool_def.prepool_id in seen_ids:
+            duplicate_ids[prepool_def.prepool_id] = None
+        else:
+            seen_ids.add(prepool_def.prepool_id)
+
+        # Check 2: No overlapping libraries
         for lib_name in prepool_def.member_library_names:
-            if lib_name not in all_libraries:
-                errors.append(
-                    f"Library '{lib_name}' in pre-pool '{prepool_def.prepool_name}' "
-                    f"not found in data"
-                )
-
-    # Check 2: No overlapping libraries
-    all_prepool_libs = []
-    for prepool_def in prepool_definitions:
-        all_prepool_libs.extend(prepool_def.member_library_names)
+            if lib_name in seen_libraries:
+                duplicate_libraries[lib_name] = None
+            else:
+                seen_libraries.add(lib_name)
+
+    # Check 1: All libraries exist. Only the referenced names are looked up in
+    # df, so no set of every library name is built; the definitions are walked
+    # again only to report any that are missing
+    library_names = df["Library Name"]
+    found_libraries = set(library_names[library_names.isin(seen_libraries)])
+    if len(found_libraries) < len(seen_libraries):
+        for prepool_def in prepool_definitions:
+            for lib_name in prepool_def.member_library_names:
+                if lib_name not in found_libraries:
+                    errors.append(
+                        f"Library '{lib_name}' in pre-pool '{prepool_def.prepool_name}' "
+                        f"not found in data"
+                    )
+
+    if duplicate_libraries:
+        errors.append(f"Libraries appear in multiple pre-pools: {', '.join(duplicate_libraries)}")
+    errors.extend(empty_errors)
+    if duplicate_ids:
+        errors.append(f"Duplicate pre-pool IDs: {', '.join(duplicate_ids)}")
 
-    if len(all_prepool_libs) != len(set(all_prepool_libs)):
-        from collections import Counter
-        counts = Counter(all_prepool_libs)
-        duplicates = [lib for lib, count in counts.items() if count > 1]
-        errors.append(f"Libraries appear in multiple pre-pools: {', '.join(duplicates)}")
+    return len(errors) == 0, errors
 
-    # Check 3: Each pre-pool has libraries
-    for prepool_def in prepool_definitions:
-        if len(prepool_def.member_library_names) == 0:
-            errors.append(f"Pre-pool '{prepool_def.prepool_name}' has no libraries")
 
-    # Check 4: Unique pre-pool IDs
-    prepool_ids = [p.prepool_id for p in prepool_definitions]
-    if len(prepool_ids) != len(set(prepool_ids)):
-        from collections import Counter
-        counts = Counter(prepool_ids)
-        duplicates = [pid for pid, count in counts.items() if count > 1]
-        errors.append(f"Duplicate pre-pool IDs: {', '.join(duplicates)}")
+def _split_duplicates(names: Iterable[str]) -> tuple[frozenset[str], list[str]]:
+    """
+    Collect the distinct names and the repeated names in one pass.
 
-    return len(errors) == 0, errors
+    Args:
+        names: Names to check, e.g. library names across all pre-pools
+
+    Returns:
+        Tuple of (frozenset of distinct names, list of names seen more than once,
+        in the order they were first repeated)
+    """
+    seen: set[str] = set()
+    duplicates: dict[str, None] = {}
+    for name in names:
+        if name in seen:
+            duplicates[name] = None
+        else:
+            seen.add(name)
+    return frozenset(seen), list(duplicates)
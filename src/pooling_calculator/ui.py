@@ -20,7 +20,9 @@ from pooling_calculator.io import (
 from pooling_calculator.validation import run_all_validations
 from pooling_calculator.compute import (
     compute_effective_molarity,
-    compute_pool_volumes,
+    compute_pooling_result_cached,
+    compute_table_key,
+    attach_to_frame,
     summarize_by_project,
 )
 from pooling_calculator.hierarchical import (
@@ -123,6 +125,7 @@ def process_upload(
     max_volume: float | None,
     total_reads: float | None,
     validated_df: pd.DataFrame | None,
+    table_key: bytes | None = None,
 ) -> tuple[str, pd.DataFrame | None, pd.DataFrame | None, pd.DataFrame | None, pd.DataFrame | None, bytes | None]:
     """
     Process uploaded file and compute pooling plan based on selected strategy.
@@ -136,6 +139,8 @@ def process_upload(
         max_volume: Maximum volume per library (optional)
         total_reads: Total sequencing reads in millions (optional)
         validated_df: Pre-validated DataFrame from analyze_file()
+        table_key: compute_table_key(validated_df), computed once per upload
+            (computed on each call if omitted)
 
     Returns:
         Tuple of (status_message, library_df, project_df, stage1_df, stage2_df, excel_bytes)
@@ -146,9 +151,6 @@ def process_upload(
     try:
         df_normalized = validated_df.copy()
 
-        # Compute molarity
-        df_with_molarity = compute_effective_molarity(df_normalized)
-
         # Validate pool parameters
         if scaling_factor <= 0:
             return "❌ Error: Scaling factor must be > 0", None, None, None, None, None
@@ -164,6 +166,9 @@ def process_upload(
         if strategy_choice == "hierarchical":
             # ========== HIERARCHICAL POOLING ==========
             try:
+                # Compute molarity
+                df_with_molarity = compute_effective_molarity(df_normalized)
+
                 plan = compute_hierarchical_pooling(
                     df_with_molarity,
                     grouping_column=grouping_column,
@@ -248,13 +253,18 @@ def process_upload(
         # ========== SINGLE-STAGE POOLING ==========
         status_msg = "✅ **SINGLE-STAGE POOLING COMPLETE**\n\n"
 
-        df_with_volumes = compute_pool_volumes(
-            df_with_molarity,
+        # Cached on table content + parameters, so re-runs with settings
+        # already tried for this upload skip the computation (the table key
+        # is hashed once per upload, not on every click)
+        pooling_result = compute_pooling_result_cached(
+            df_normalized,
             scaling_factor=scaling_factor,
             min_volume_ul=min_volume,
             max_volume_ul=max_vol,
             total_reads_m=total_r,
+            table_key=table_key,
         )
+        df_with_volumes = attach_to_frame(df_normalized, pooling_result)
 
         # Check for flags
         flagged = df_with_volumes[df_with_volumes["Flags"] != ""]
@@ -930,6 +940,7 @@ def build_app() -> gr.Blocks:
         excel_state = gr.State(value=None)
         prepool_excel_state = gr.State(value=None)  # For pre-pooling Excel
         validated_df_state = gr.State(value=None)
+        table_key_state = gr.State(value=None)  # Content hash of validated_df for the result cache
         df_with_molarity_state = gr.State(value=None)  # For pre-pooling
         recommended_strategy_state = gr.State(value="single_stage")
         grouping_options_state = gr.State(value=[])
@@ -942,9 +953,13 @@ def build_app() -> gr.Blocks:
             # Enable calculate button and update strategy selection
             show_grouping = strategy == "hierarchical" and len(grouping_opts) > 0
 
+            # Hash the table once per upload for the pooling result cache
+            table_key = compute_table_key(df) if df is not None else None
+
             return (
                 status,
                 df,
+                table_key,
                 strategy,
                 grouping_opts,
                 analysis,
@@ -959,6 +974,7 @@ def build_app() -> gr.Blocks:
             outputs=[
                 status_output,
                 validated_df_state,
+                table_key_state,
                 recommended_strategy_state,
                 grouping_options_state,
                 analysis_state,
@@ -988,6 +1004,7 @@ def build_app() -> gr.Blocks:
             max_vol,
             total_r,
             validated_df,
+            table_key,
         ):
             status, lib_df, proj_df, stage1_df, stage2_df, excel_bytes = process_upload(
                 file_obj,
@@ -998,6 +1015,7 @@ def build_app() -> gr.Blocks:
                 max_vol,
                 total_r,
                 validated_df,
+                table_key,
             )
 
             # Show download button if successful
@@ -1042,6 +1060,7 @@ def build_app() -> gr.Blocks:
                 max_volume,
                 total_reads,
                 validated_df_state,
+                table_key_state,
             ],
             outputs=[
                 status_output,
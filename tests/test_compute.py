@@ -12,7 +12,14 @@ from pooling_calculator.compute import (
     compute_molarity_from_concentration,
     compute_effective_molarity,
     compute_pool_volumes,
+    compute_pool_volumes_grouped,
+    compute_pooling_result,
+    compute_pooling_result_cached,
+    compute_table_key,
+    attach_to_frame,
     summarize_by_project,
+    _volume_arrays_numpy,
+    _volume_kernel,
 )
 from pooling_calculator.config import MW_PER_BP
 
@@ -141,6 +148,18 @@ def test_compute_effective_molarity_missing_columns():
         compute_effective_molarity(df)
 
 
+def test_compute_effective_molarity_invalid_row_reported():
+    """compute_effective_molarity should report the first invalid row."""
+    df = pd.DataFrame({
+        "Library Name": ["Lib001", "Lib002", "Lib003"],
+        "Final ng/ul": [1.0, 0.0, 2.0],
+        "Adjusted peak size": [200, 200, -5],
+    })
+
+    with pytest.raises(ValueError, match="Row 2: Concentration must be > 0"):
+        compute_effective_molarity(df)
+
+
 def test_compute_effective_molarity_real_data():
     """compute_effective_molarity should match expected values for 7050I data."""
     # Test with first 3 libraries from 7050I
@@ -377,6 +396,143 @@ def test_compute_pool_volumes_real_data_sample():
     assert pytest.approx(result["Stock Volume (µl)"].iloc[2], rel=1e-2) == 0.811
 
 
+def test_compute_pool_volumes_grouped_matches_per_group():
+    """compute_pool_volumes_grouped should match compute_pool_volumes run per group."""
+    df = pd.DataFrame({
+        "Library Name": ["Lib1", "Lib2", "Lib3", "Lib4", "Lib5"],
+        "Pool": ["B", "A", "B", "A", "A"],
+        "Adjusted lib nM": [10.0, 2.0, 5.0, 40.0, 8.0],
+        "Target Reads (M)": [10.0, 20.0, 10.0, 5.0, 10.0],
+    })
+
+    result = compute_pool_volumes_grouped(df, "Pool", max_volume_ul=5.0, total_reads_m=100.0)
+
+    assert list(result["Library Name"]) == list(df["Library Name"])
+    for _, group_df in df.groupby("Pool"):
+        expected = compute_pool_volumes(group_df, max_volume_ul=5.0, total_reads_m=100.0)
+        pd.testing.assert_frame_equal(result.loc[group_df.index], expected)
+
+    # Pool fractions sum to 1 within each pool
+    np.testing.assert_allclose(result.groupby("Pool")["Pool Fraction"].sum(), 1.0)
+
+
+def test_volume_kernel_matches_numpy_implementation():
+    """The (optionally Numba-compiled) volume kernel should match the NumPy path."""
+    adj_lib_nm = np.array([13.595, 13.037, 12.334, 150.0, np.nan])
+    target_reads = np.array([100.0, 10.0, 100.0, 5.0, 10.0])
+
+    expected = _volume_arrays_numpy(adj_lib_nm, target_reads, 0.1, 0.2, 0.795)
+    actual = _volume_kernel(adj_lib_nm, target_reads, 0.1, 0.2, 0.795)
+
+    for exp, act in zip(expected, actual):
+        assert act.dtype == exp.dtype
+        np.testing.assert_allclose(act, exp, rtol=1e-12, equal_nan=True)
+
+
+def test_volume_numexpr_matches_numpy_implementation():
+    """The numexpr volume path should match the NumPy path."""
+    pytest.importorskip("numexpr")
+    from pooling_calculator.compute import _volume_arrays_numexpr
+
+    adj_lib_nm = np.array([13.595, 13.037, 12.334, 150.0, np.nan])
+    target_reads = np.array([100.0, 10.0, 100.0, 5.0, 10.0])
+
+    expected = _volume_arrays_numpy(adj_lib_nm, target_reads, 0.1, 0.2, 0.795)
+    actual = _volume_arrays_numexpr(adj_lib_nm, target_reads, 0.1, 0.2, 0.795)
+
+    for exp, act in zip(expected, actual):
+        assert act.dtype == exp.dtype
+        np.testing.assert_allclose(act, exp, rtol=1e-12, equal_nan=True)
+
+
+# ============================================================================
+# compute_pooling_result / attach_to_frame Tests
+# ============================================================================
+
+
+def test_compute_pooling_result_matches_dataframe_pipeline():
+    """attach_to_frame(compute_pooling_result()) should match the two-step pipeline."""
+    df = pd.DataFrame({
+        "Library Name": ["Lib1", "Lib2", "Lib3"],
+        "Final ng/ul": [2.0, 0.5, 10.0],
+        "Adjusted peak size": [300, 300, 400],
+        "Empirical Library nM": [np.nan, 4.0, np.nan],
+        "Target Reads (M)": [10.0, 20.0, 10.0],
+        "Total Volume": [30.0, 30.0, 30.0],
+    })
+
+    expected = compute_pool_volumes(
+        compute_effective_molarity(df), max_volume_ul=1.0, total_reads_m=100.0
+    )
+    result = compute_pooling_result(df, max_volume_ul=1.0, total_reads_m=100.0)
+    actual = attach_to_frame(df, result)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert list(df.columns) == list(actual.columns[: len(df.columns)])
+
+
+def test_attach_to_frame_length_mismatch():
+    """attach_to_frame should reject a result computed from a different frame."""
+    df = pd.DataFrame({
+        "Final ng/ul": [2.0, 3.0],
+        "Adjusted peak size": [300, 300],
+        "Target Reads (M)": [10.0, 10.0],
+    })
+    result = compute_pooling_result(df)
+
+    with pytest.raises(ValueError, match="rows"):
+        attach_to_frame(df.iloc[:1], result)
+
+
+def test_compute_table_key_is_content_addressed():
+    """compute_table_key should depend on table contents, not object identity."""
+    df = pd.DataFrame({"Library Name": ["Lib1", "Lib2"], "Final ng/ul": [2.0, 3.0]})
+
+    assert compute_table_key(df) == compute_table_key(df.copy())
+    changed = df.assign(**{"Final ng/ul": [2.0, 3.5]})
+    assert compute_table_key(df) != compute_table_key(changed)
+
+
+def test_compute_pooling_result_cached_reuses_result():
+    """compute_pooling_result_cached should return the stored result for repeat parameters."""
+    df = pd.DataFrame({
+        "Final ng/ul": [2.0, 3.0],
+        "Adjusted peak size": [300, 300],
+        "Target Reads (M)": [10.0, 10.0],
+    })
+
+    first = compute_pooling_result_cached(df, scaling_factor=0.1)
+    again = compute_pooling_result_cached(df.copy(), scaling_factor=0.1)
+    other = compute_pooling_result_cached(df, scaling_factor=0.2)
+
+    assert again is first
+    assert other is not first
+    np.testing.assert_allclose(other.stock_vol, first.stock_vol * 2)
+
+
+def test_compute_pooling_result_cached_concurrent_calls():
+    """Concurrent calls that hit, insert and evict cache entries should not fail."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    df = pd.DataFrame({
+        "Final ng/ul": [2.0, 3.0],
+        "Adjusted peak size": [300, 300],
+        "Target Reads (M)": [10.0, 10.0],
+    })
+    table_key = compute_table_key(df)
+    # More distinct parameter sets than the cache holds, so entries are evicted
+    factors = [0.01 * (i % 40 + 1) for i in range(400)]
+
+    def run(factor):
+        return compute_pooling_result_cached(df, scaling_factor=factor, table_key=table_key)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(run, factors))
+
+    for factor, result in zip(factors, results):
+        np.testing.assert_allclose(result.stock_vol, results[0].stock_vol / factors[0] * factor)
+
+
 # ============================================================================
 # summarize_by_project Tests
 # ============================================================================
@@ -0,0 +1,39 @@
+"""
+Unit tests for configuration helpers.
+
+Tests column name normalization against the alias table.
+"""
+
+import pytest
+
+from pooling_calculator.config import (
+    REQUIRED_COLUMNS,
+    OPTIONAL_COLUMNS,
+    normalize_column_name,
+)
+
+
+# ============================================================================
+# normalize_column_name Tests
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    "raw_name, expected",
+    [
+        ("Project ID", "Project ID"),
+        ("  project id ", "Project ID"),
+        ("FINAL NG/UL", "Final ng/ul"),
+        ("qpcr_nm", "Empirical Library nM"),
+        ("Notes", "Notes"),
+    ],
+)
+def test_normalize_column_name(raw_name, expected):
+    """normalize_column_name should match case-insensitively and keep unknown names."""
+    assert normalize_column_name(raw_name) == expected
+
+
+def test_normalize_column_name_standard_names_map_to_themselves():
+    """normalize_column_name should return every standard column name unchanged."""
+    for col in REQUIRED_COLUMNS + OPTIONAL_COLUMNS:
+        assert normalize_column_name(col) == col
@@ -61,6 +61,25 @@ def test_determine_pooling_strategy_large_with_good_grouping():
     assert analysis["Project ID_viable"] == True
 
 
+def test_determine_pooling_strategy_categorical_ignores_unused_categories():
+    """Test that unused categories of a categorical grouping column aren't counted."""
+    projects = [f"Proj{i}" for i in range(10)]
+    df = pd.DataFrame({
+        "Project ID": pd.Categorical(["Proj0"] * 100 + ["Proj1"] * 100, categories=projects),
+        "Library Name": [f"Lib{i:03d}" for i in range(200)],
+    })
+
+    strategy, grouping_options, analysis = determine_pooling_strategy(df)
+
+    assert analysis["Project ID_num_groups"] == 2
+    assert "Project ID" not in grouping_options
+
+    result = create_subpool_definitions(df, grouping_column="Project ID")
+    assert set(result["SubPool ID"]) == {
+        "Proj0_pool_1", "Proj0_pool_2", "Proj1_pool_1", "Proj1_pool_2"
+    }
+
+
 def test_determine_pooling_strategy_large_no_grouping_column():
     """Test large experiment without grouping column still recommends hierarchical."""
     # Create 150 libraries without "Project ID" column
@@ -274,6 +293,21 @@ def test_create_subpool_definitions_custom_grouping_column():
     assert (type_b["SubPool ID"] == "TypeB_pool").all()
 
 
+def test_create_subpool_definitions_interleaved_groups():
+    """Test that sub-pool labels follow their rows when groups are not contiguous."""
+    df = pd.DataFrame({
+        "Project ID": ["ProjectB", "ProjectA", "ProjectB", "ProjectA"],
+        "Library Name": ["Lib1", "Lib2", "Lib3", "Lib4"],
+    })
+
+    result = create_subpool_definitions(df, grouping_column="Project ID")
+
+    assert list(result["SubPool ID"]) == [
+        "ProjectB_pool", "ProjectA_pool", "ProjectB_pool", "ProjectA_pool"
+    ]
+    assert "SubPool ID" not in df.columns
+
+
 # ============================================================================
 # Test compute_subpool_properties
 # ============================================================================
@@ -319,6 +353,32 @@ def test_compute_subpool_properties_equimolar():
     assert result.parent_project_id == "ProjectA"
 
 
+def test_compute_subpool_properties_assume_aligned_matches_merge():
+    """Test that the aligned fast path gives the same record as the merge path."""
+    df_libraries = pd.DataFrame({
+        "Library Name": ["Lib1", "Lib2", "Lib3"],
+        "Adjusted lib nM": [10.0, 20.0, 5.0],
+        "Target Reads (M)": [100, 50, 25],
+        "Project ID": ["ProjectA", "ProjectA", "ProjectA"],
+    })
+    df_volumes = df_libraries.assign(**{"Final Volume (µl)": [1.0, 2.0, 4.0]})
+
+    merged = compute_subpool_properties(df_libraries, df_volumes, "ProjectA_pool")
+    aligned = compute_subpool_properties(
+        df_volumes, df_volumes, "ProjectA_pool", assume_aligned=True
+    )
+
+    assert aligned.member_libraries == merged.member_libraries
+    assert aligned.total_volume_ul == merged.total_volume_ul
+    assert pytest.approx(aligned.calculated_nm, rel=1e-12) == merged.calculated_nm
+    assert aligned.target_reads_m == merged.target_reads_m
+
+    with pytest.raises(ValueError, match="same length"):
+        compute_subpool_properties(
+            df_libraries, df_volumes.iloc[:2], "ProjectA_pool", assume_aligned=True
+        )
+
+
 def test_compute_subpool_properties_different_concentrations():
     """Test sub-pool molarity with different concentrations."""
     df_libraries = pd.DataFrame({
@@ -698,3 +758,27 @@ def test_compute_subpool_properties_zero_volume():
             df_volumes,
             subpool_id="pool"
         )
+
+
+def test_compute_subpool_properties_missing_values():
+    """Missing volumes and molarities should be skipped, and a NaN sub-pool rejected."""
+    df_libraries = pd.DataFrame({
+        "Library Name": ["Lib1", "Lib2"],
+        "Adjusted lib nM": [10.0, float("nan")],
+        "Target Reads (M)": [100, 100],
+    })
+    df_volumes = pd.DataFrame({
+        "Library Name": ["Lib1", "Lib2"],
+        "Final Volume (µl)": [2.0, 2.0],
+    })
+
+    # Like pandas' sum, the library with a missing molarity adds no moles
+    subpool = compute_subpool_properties(df_libraries, df_volumes, subpool_id="pool")
+    assert subpool.total_volume_ul == pytest.approx(4.0)
+    assert subpool.calculated_nm == pytest.approx(5.0)
+
+    # A NaN total must not pass the positivity constraints
+    df_libraries["Adjusted lib nM"] = float("inf")
+    df_volumes["Final Volume (µl)"] = [float("inf"), 2.0]
+    with pytest.raises(ValueError, match="must have positive"):
+        compute_subpool_properties(df_libraries, df_volumes, subpool_id="pool")
@@ -13,6 +13,7 @@ from pooling_calculator.io import (
     load_spreadsheet,
     normalize_dataframe_columns,
     dataframe_to_dict_list,
+    iter_library_records,
     export_results_to_excel,
     generate_export_filename,
     create_library_dataframe_for_export,
@@ -54,6 +55,54 @@ def test_load_spreadsheet_from_bytes():
     assert len(df) == 5
 
 
+def test_load_spreadsheet_engine_matches_openpyxl():
+    """load_spreadsheet's default engine should read the same data as openpyxl."""
+    file_path = FIXTURES_DIR / "valid_pool.xlsx"
+
+    default_df = load_spreadsheet(file_path)
+    openpyxl_df = load_spreadsheet(file_path, engine="openpyxl")
+
+    pd.testing.assert_frame_equal(default_df, openpyxl_df)
+
+
+def test_load_spreadsheet_casts_numeric_columns_to_float(tmp_path):
+    """Numeric library columns should load as float64; text columns are left for validation."""
+    csv_path = tmp_path / "libraries.csv"
+    csv_path.write_text(
+        "project,Library Name,Total Volume,reads,Adjusted peak size\n"
+        "P1,Lib_001,30,10,unknown\n"
+        "P1,Lib_002,25,20,450\n"
+    )
+
+    df = load_spreadsheet(csv_path)
+
+    assert list(df.columns) == ["project", "Library Name", "Total Volume", "reads", "Adjusted peak size"]
+    assert df["Total Volume"].dtype == "float64"
+    assert df["reads"].dtype == "float64"
+    assert df["Adjusted peak size"].tolist() == ["unknown", "450"]
+
+
+@pytest.mark.parametrize("csv_engine", ["pyarrow", "c"])
+def test_load_spreadsheet_csv_short_rows(tmp_path, monkeypatch, csv_engine):
+    """CSV rows that omit trailing optional fields should load with NaN padding."""
+    if csv_engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr("pooling_calculator.io._CSV_ENGINE", csv_engine)
+
+    csv_path = tmp_path / "libraries.csv"
+    csv_path.write_text(
+        "Library Name,Total Volume,Empirical Library nM\n"
+        "Lib_001,30,12.5\n"
+        "Lib_002,25\n"
+    )
+
+    df = load_spreadsheet(csv_path)
+
+    assert df["Library Name"].tolist() == ["Lib_001", "Lib_002"]
+    assert df["Empirical Library nM"].iloc[0] == 12.5
+    assert pd.isna(df["Empirical Library nM"].iloc[1])
+
+
 def test_load_spreadsheet_file_not_found():
     """load_spreadsheet should raise FileNotFoundError for missing file."""
     with pytest.raises(FileNotFoundError):
@@ -155,6 +204,32 @@ def test_dataframe_to_dict_list_handles_nan():
     assert dict_list[2]["Col2"] is None
 
 
+# ============================================================================
+# iter_library_records Tests
+# ============================================================================
+
+
+def test_iter_library_records_yields_models():
+    """iter_library_records should yield a validated LibraryRecord per row."""
+    df = pd.DataFrame({
+        "project_id": ["Project_A", "Project_B"],
+        "library_name": [" Lib_001 ", "Lib_002"],
+        "final_ng_per_ul": [12.5, 3.0],
+        "total_volume_ul": [30.0, 20.0],
+        "barcode": ["ATCG", "GGTA"],
+        "adjusted_peak_size_bp": [450, 300],
+        "empirical_nm": [None, 5.0],
+        "target_reads_m": [10.0, 20.0],
+    })
+
+    records = list(iter_library_records(df))
+
+    assert [r.library_name for r in records] == ["Lib_001", "Lib_002"]
+    assert records[0].empirical_nm is None
+    assert records[1].empirical_nm == 5.0
+    assert records[0].adjusted_peak_size_bp == 450.0
+
+
 # ============================================================================
 # export_results_to_excel Tests
 # ============================================================================
@@ -181,6 +256,18 @@ def test_export_results_to_excel_returns_bytes():
     assert len(result) > 0
 
 
+def test_export_results_to_excel_returns_stream():
+    """export_results_to_excel should return a rewound buffer when return_stream is set."""
+    library_df = pd.DataFrame({"Project ID": ["Project_A"], "Library Name": ["Lib_001"]})
+    project_df = pd.DataFrame({"Project ID": ["Project_A"], "Library Count": [1]})
+
+    result = export_results_to_excel(library_df, project_df, return_stream=True)
+
+    assert isinstance(result, BytesIO)
+    assert result.tell() == 0
+    assert "Metadata" in pd.ExcelFile(result).sheet_names
+
+
 def test_export_results_to_excel_saves_to_file():
     """export_results_to_excel should save file when output_path given."""
     library_data = {
@@ -240,6 +327,55 @@ def test_export_results_metadata_includes_timestamp():
     assert "Generated At" in metadata_df["Parameter"].values
 
 
+@pytest.mark.parametrize("writer", ["openpyxl", "xlsxwriter"])
+def test_export_results_column_widths_fit_content(monkeypatch, writer):
+    """Exported columns should be sized to their longest value, capped at 50."""
+    from openpyxl import load_workbook
+
+    if writer == "xlsxwriter":
+        pytest.importorskip("xlsxwriter")
+    monkeypatch.setattr("pooling_calculator.io._XLSX_WRITER", writer)
+
+    library_df = pd.DataFrame({
+        "Library Name": ["Lib_001", "A_much_longer_library_name_0001"],
+        "Notes": ["x" * 80, None],
+    })
+    project_df = pd.DataFrame({"Project ID": ["Project_A"]})
+
+    excel_bytes = export_results_to_excel(library_df, project_df)
+
+    # xlsxwriter stores widths with Excel's cell padding added
+    worksheet = load_workbook(BytesIO(excel_bytes))["PoolingPlan_Libraries"]
+    assert int(worksheet.column_dimensions["A"].width) == len("A_much_longer_library_name_0001") + 2
+    assert int(worksheet.column_dimensions["B"].width) == 50
+
+
+@pytest.mark.parametrize("writer", ["openpyxl", "xlsxwriter"])
+def test_export_results_writers_round_trip(monkeypatch, writer):
+    """Both export writers should produce sheets that read back identically."""
+    if writer == "xlsxwriter":
+        pytest.importorskip("xlsxwriter")
+    monkeypatch.setattr("pooling_calculator.io._XLSX_WRITER", writer)
+
+    library_df = pd.DataFrame({
+        "Library Name": ["Lib_001", "Lib_002", "Lib_003"],
+        "Volume to Add (µl)": [5.0, None, 2.5],
+        "Pool Fraction": [float("inf"), 0.5, float("-inf")],
+        "Flags": ["", "PRE_DILUTE", ""],
+    })
+    project_df = pd.DataFrame({"Project ID": ["Project_A"], "Library Count": [3]})
+
+    excel_bytes = export_results_to_excel(library_df, project_df)
+
+    read_back = pd.read_excel(
+        BytesIO(excel_bytes), sheet_name="PoolingPlan_Libraries", keep_default_na=False, na_values=[""]
+    )
+    assert read_back["Library Name"].tolist() == ["Lib_001", "Lib_002", "Lib_003"]
+    assert read_back["Volume to Add (µl)"].isna().tolist() == [False, True, False]
+    assert read_back["Volume to Add (µl)"].iloc[2] == 2.5
+    assert read_back["Pool Fraction"].tolist() == [float("inf"), 0.5, float("-inf")]
+
+
 # ============================================================================
 # generate_export_filename Tests
 # ============================================================================
@@ -13,7 +13,11 @@ from pooling_calculator.models import (
     ProjectSummary,
     PoolingParams,
     ValidationResult,
+    PoolingStage,
+    PoolingStageData,
+    HierarchicalPoolingPlan,
     create_library_from_dict,
+    create_libraries_from_dicts,
     create_pooling_params,
 )
 
@@ -130,6 +134,37 @@ def test_library_record_negative_empirical_nm_fails():
         )
 
 
+def test_library_record_is_frozen():
+    """LibraryRecord fields should not be reassignable after creation."""
+    lib = LibraryRecord(
+        project_id="Project_A",
+        library_name="Lib_001",
+        final_ng_per_ul=12.5,
+        total_volume_ul=30.0,
+        barcode="ATCG-GGTA",
+        adjusted_peak_size_bp=450.0,
+        target_reads_m=10.0,
+    )
+
+    with pytest.raises(ValidationError):
+        lib.final_ng_per_ul = 20.0
+
+
+def test_library_record_unknown_field_fails():
+    """Unknown fields should raise ValidationError instead of being ignored."""
+    with pytest.raises(ValidationError):
+        LibraryRecord(
+            project_id="Project_A",
+            library_name="Lib_001",
+            final_ng_per_ul=12.5,
+            total_volume_ul=30.0,
+            barcode="ATCG-GGTA",
+            adjusted_peak_size_bp=450.0,
+            target_reads_m=10.0,
+            notes="extra",  # Invalid
+        )
+
+
 # ============================================================================
 # LibraryWithComputedFields Tests
 # ============================================================================
@@ -371,6 +406,48 @@ def test_validation_result_get_report():
     assert "num_libraries: 24" in report
 
 
+# ============================================================================
+# HierarchicalPoolingPlan Tests
+# ============================================================================
+
+
+def _stage(stage_number: int) -> PoolingStageData:
+    return PoolingStageData(
+        stage=PoolingStage.LIBRARY_TO_SUBPOOL,
+        stage_number=stage_number,
+        input_count=2,
+        output_count=1,
+        volumes_df_json=[],
+        total_pipetting_steps=2,
+        description="test stage",
+    )
+
+
+def _plan(stages: list[PoolingStageData]) -> HierarchicalPoolingPlan:
+    return HierarchicalPoolingPlan(
+        stages=stages,
+        final_pool_volume_ul=20.0,
+        total_libraries=2,
+        total_subpools=1,
+        strategy="hierarchical",
+        grouping_method="by_project",
+        total_pipetting_steps=3,
+    )
+
+
+def test_hierarchical_plan_sequential_stages():
+    """Stages numbered 1, 2, ... should be accepted."""
+    plan = _plan([_stage(1), _stage(2)])
+    assert [stage.stage_number for stage in plan.stages] == [1, 2]
+
+
+@pytest.mark.parametrize("numbers", [[2], [1, 3], [2, 1]])
+def test_hierarchical_plan_non_sequential_stages_fail(numbers):
+    """Stages not numbered 1, 2, ... should raise ValidationError."""
+    with pytest.raises(ValidationError, match="sequential"):
+        _plan([_stage(n) for n in numbers])
+
+
 # ============================================================================
 # Helper Function Tests
 # ============================================================================
@@ -393,6 +470,27 @@ def test_create_library_from_dict():
     assert lib.library_name == "Lib_001"
 
 
+def test_create_libraries_from_dicts():
+    """create_libraries_from_dicts should validate a list of dicts in one call."""
+    base = {
+        "project_id": "Project_A",
+        "final_ng_per_ul": 12.5,
+        "total_volume_ul": 30.0,
+        "barcode": "ATCG-GGTA",
+        "adjusted_peak_size_bp": 450.0,
+        "target_reads_m": 10.0,
+    }
+    records = [{**base, "library_name": "Lib_001"}, {**base, "library_name": " Lib_002 "}]
+
+    libs = create_libraries_from_dicts(records)
+
+    assert [lib.library_name for lib in libs] == ["Lib_001", "Lib_002"]
+    assert all(isinstance(lib, LibraryRecord) for lib in libs)
+
+    with pytest.raises(ValidationError):
+        create_libraries_from_dicts([{**base, "library_name": "Lib_003", "target_reads_m": 0}])
+
+
 def test_create_pooling_params_with_defaults():
     """create_pooling_params should use defaults for optional parameters."""
     params = create_pooling_params(pool_volume=50.0)
@@ -0,0 +1,162 @@
+"""
+Unit tests for pre-pooling functions.
+
+Tests user-defined pre-pools: member volumes, pre-pool properties, and the
+final pool built from pre-pools plus standalone libraries.
+"""
+
+import pytest
+import pandas as pd
+
+from pooling_calculator.models import PrePoolDefinition
+from pooling_calculator.prepooling import (
+    create_prepool_from_selection,
+    compute_with_prepools,
+    validate_prepool_definitions,
+    _frame_records,
+)
+
+
+def _libraries() -> pd.DataFrame:
+    return pd.DataFrame({
+        "Project ID": ["ProjA", "ProjA", "ProjB", "ProjB", "ProjC"],
+        "Library Name": ["Lib1", "Lib2", "Lib3", "Lib4", "Lib5"],
+        "Adjusted lib nM": [5.0, 10.0, 8.0, 4.0, 12.0],
+        "Target Reads (M)": [10.0, 20.0, 10.0, 10.0, 30.0],
+        "Total Volume": [30.0, 30.0, 30.0, 30.0, 30.0],
+    })
+
+
+def _definition(prepool_id: str, names: list[str]) -> PrePoolDefinition:
+    return PrePoolDefinition(
+        prepool_id=prepool_id,
+        prepool_name=prepool_id.replace("_", " ").title(),
+        member_library_names=names,
+    )
+
+
+# ============================================================================
+# Test create_prepool_from_selection
+# ============================================================================
+
+
+def test_create_prepool_from_selection_keeps_dataframe_order():
+    """Members should follow DataFrame order regardless of selection order."""
+    result = create_prepool_from_selection(_libraries(), ["Lib3", "Lib1"], "Prepool 1", 0.1, 0.2, None)
+
+    assert [row["Library Name"] for row in result.member_volumes_json] == ["Lib1", "Lib3"]
+    assert result.prepool_definition.prepool_id == "prepool_1"
+    assert result.target_reads_m == pytest.approx(20.0)
+
+
+def test_create_prepool_from_selection_validates_definition():
+    """The pre-pool definition should be validated like a user-built one."""
+    result = create_prepool_from_selection(_libraries(), ["Lib1"], "  Prepool 1  ", 0.1, 0.2, None)
+
+    assert result.prepool_definition.prepool_name == "Prepool 1"
+
+
+def test_create_prepool_from_selection_missing_library_raises_error():
+    """Selecting a library not in the DataFrame should raise ValueError."""
+    with pytest.raises(ValueError, match="not found"):
+        create_prepool_from_selection(_libraries(), ["Lib1", "Missing"], "Prepool 1", 0.1, 0.2, None)
+
+
+# ============================================================================
+# Test compute_with_prepools
+# ============================================================================
+
+
+def test_compute_with_prepools_combines_prepools_and_standalone_libraries():
+    """Final pool should hold each pre-pool once plus every library not in a pre-pool."""
+    df = _libraries()
+    df["Barcode"] = ["AAA", "CCC", "GGG", "TTT", "ACG"]
+    plan = compute_with_prepools(
+        df, [_definition("prepool_1", ["Lib1", "Lib2"])], 0.1, 0.2, None, 100.0
+    )
+
+    final_names = [row["Library Name"] for row in plan.final_pool_json]
+    assert final_names == ["Lib3", "Lib4", "Lib5", "prepool_1"]
+    assert [row["Library Name"] for row in plan.remaining_libraries_json] == ["Lib3", "Lib4", "Lib5"]
+    # Standalone libraries keep their full input records
+    assert plan.remaining_libraries_json == df.iloc[2:].to_dict(orient="records")
+    assert plan.libraries_in_prepools == 2
+    assert plan.standalone_libraries == 3
+    assert plan.prepools[0].prepool_definition.created_at == plan.created_at
+
+
+def test_compute_with_prepools_overlapping_libraries_raise_error():
+    """A library in two pre-pools should raise ValueError."""
+    definitions = [
+        _definition("prepool_1", ["Lib1", "Lib2"]),
+        _definition("prepool_2", ["Lib2", "Lib3"]),
+    ]
+
+    with pytest.raises(ValueError, match=r"multiple pre-pools: \['Lib2'\]"):
+        compute_with_prepools(_libraries(), definitions, 0.1, 0.2, None, None)
+
+
+# ============================================================================
+# Test validate_prepool_definitions
+# ============================================================================
+
+
+def test_validate_prepool_definitions_reports_all_problems():
+    """Missing libraries, overlaps and duplicate IDs should each be reported."""
+    definitions = [
+        _definition("prepool_1", ["Lib1", "Lib2"]),
+        _definition("prepool_1", ["Lib2", "Missing"]),
+    ]
+
+    is_valid, errors = validate_prepool_definitions(_libraries(), definitions)
+
+    assert not is_valid
+    assert errors == [
+        "Library 'Missing' in pre-pool 'Prepool 1' not found in data",
+        "Libraries appear in multiple pre-pools: Lib2",
+        "Duplicate pre-pool IDs: prepool_1",
+    ]
+
+
+def test_validate_prepool_definitions_valid():
+    """Disjoint pre-pools of existing libraries should be valid."""
+    definitions = [
+        _definition("prepool_1", ["Lib1", "Lib2"]),
+        _definition("prepool_2", ["Lib3"]),
+    ]
+
+    assert validate_prepool_definitions(_libraries(), definitions) == (True, [])
+
+
+# ============================================================================
+# Test _frame_records
+# ============================================================================
+
+
+def test_frame_records_matches_to_dict():
+    """Row records should equal to_dict(orient="records"), including scalar types."""
+    df = _libraries()
+    df["Pre-Dilute Factor"] = pd.array([1, 10, 1, 1, 1], dtype="int32")
+    df.loc[2, "Total Volume"] = float("nan")
+    df["Notes"] = pd.Series(["a", None, "c", "d", "e"], dtype="str")
+    df["Replicate"] = pd.array([1, None, 2, 3, 4], dtype="Int64")
+    df["Passed QC"] = pd.array([True, None, False, True, True], dtype="boolean")
+    df["Prepared At"] = pd.to_datetime(["2024-01-01 00:00:00.000000001"] * 5)
+    df["Run Time"] = pd.to_timedelta([1, 2, 3, 4, 5], unit="s")
+    df["Extra"] = pd.Series([None, "x", 1.5, "y", "z"], dtype=object)
+
+    records = _frame_records(df)
+    expected = df.to_dict(orient="records")
+
+    assert [list(r) for r in records] == [list(r) for r in expected]
+    for row, expected_row in zip(records, expected):
+        for key, value in row.items():
+            assert type(value) is type(expected_row[key])
+            assert value is expected_row[key] or value == expected_row[key] or (
+                value != value and expected_row[key] != expected_row[key]
+            )
+
+
+def test_frame_records_empty_frame():
+    """An empty frame should give no records."""
+    assert _frame_records(_libraries().iloc[:0]) == []